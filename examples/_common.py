@@ -0,0 +1,116 @@
+"""
+Helpers shared by the pricing analyst example modules.
+"""
+
+from functools import cache
+
+from structured_query_builder import (
+    AggregateExpr,
+    AggregateFunc,
+    CaseWhen,
+    Column,
+    ColumnExpr,
+    ComparisonOp,
+    ConditionGroup,
+    Direction,
+    FromClause,
+    LogicOp,
+    OrderByItem,
+    Query,
+    SimpleCondition,
+    Table,
+    WhereL1,
+    qcol,
+)
+from structured_query_builder.translator import translate_query
+
+# Translated SQL keyed by structural fingerprint, so identical query trees
+# share one translation across examples and repeated main() runs. Keys are the
+# full JSON text, not its hash, so distinct queries never collide; the oldest
+# entry is evicted once the cache is full.
+_SQL_CACHE_SIZE = 128
+_SQL_BY_FINGERPRINT: dict[str, str] = {}
+
+
+def fingerprint(query: Query) -> str:
+    """Structural key of a query: its canonical JSON form."""
+    return query.model_dump_json(exclude_none=True, by_alias=True)
+
+
+def translate_query_cached(query: Query) -> str:
+    """Translate a query, reusing the SQL of any query with the same fingerprint."""
+    key = fingerprint(query)
+    sql = _SQL_BY_FINGERPRINT.get(key)
+    if sql is None:
+        if len(_SQL_BY_FINGERPRINT) >= _SQL_CACHE_SIZE:
+            del _SQL_BY_FINGERPRINT[next(iter(_SQL_BY_FINGERPRINT))]
+        sql = _SQL_BY_FINGERPRINT[key] = translate_query(query)
+    return sql
+
+
+# =============================================================================
+# Shared column references (frozen, so safe to share by identity)
+# =============================================================================
+
+@cache
+def col(column: Column, alias: str | None = None, table_alias: str | None = None) -> ColumnExpr:
+    """Shared ColumnExpr for each (column, alias, table_alias) triple."""
+    return ColumnExpr(source=qcol(column, table_alias), alias=alias)
+
+
+# =============================================================================
+# Shared query fragments (read-only, reused across example modules)
+# =============================================================================
+
+FROM_PRODUCT_OFFERS = FromClause(table=Table.product_offers)
+
+# WHERE is_markdown = TRUE
+MARKDOWN_WHERE = WhereL1(
+    groups=[
+        ConditionGroup(
+            conditions=[
+                SimpleCondition(
+                    column=qcol(Column.is_markdown),
+                    operator=ComparisonOp.eq,
+                    value=True
+                )
+            ],
+            logic=LogicOp.and_
+        )
+    ],
+    group_logic=LogicOp.and_
+)
+
+_PRICE_STATS_AGGS = (
+    AggregateExpr(function=AggregateFunc.count, column=None, alias="product_count"),
+    AggregateExpr(function=AggregateFunc.avg, column=Column.regular_price, alias="avg_price"),
+    AggregateExpr(function=AggregateFunc.min, column=Column.regular_price, alias="min_price"),
+    AggregateExpr(function=AggregateFunc.max, column=Column.regular_price, alias="max_price"),
+)
+
+
+def price_stats_aggs() -> list[AggregateExpr]:
+    """COUNT(*), AVG/MIN/MAX(regular_price) as a fresh list of shared expressions."""
+    return list(_PRICE_STATS_AGGS)
+
+
+ORDER_PRICE_DESC = OrderByItem(column=Column.regular_price, direction=Direction.desc)
+ORDER_PRICE_ASC = OrderByItem(column=Column.regular_price, direction=Direction.asc)
+ORDER_CATEGORY_ASC = OrderByItem(column=Column.category, direction=Direction.asc)
+ORDER_CREATED_AT_ASC = OrderByItem(column=Column.created_at, direction=Direction.asc)
+
+# (upper bound, tier) pairs for CASE WHEN regular_price < bound THEN tier
+PRICE_TIERS = ((20, "budget"), (50, "value"), (100, "standard"))
+
+
+def tier_whens() -> list[CaseWhen]:
+    """CASE branches classifying regular_price into PRICE_TIERS."""
+    return [
+        CaseWhen(
+            condition_column=Column.regular_price,
+            condition_operator=ComparisonOp.lt,
+            condition_value=bound,
+            then_value=tier
+        )
+        for bound, tier in PRICE_TIERS
+    ]
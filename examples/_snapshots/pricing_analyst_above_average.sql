@@ -0,0 +1,5 @@
+SELECT title,
+       category,
+       regular_price
+FROM product_offers
+WHERE regular_price > (SELECT AVG(regular_price) AS avg_price FROM product_offers GROUP BY category)
@@ -0,0 +1,6 @@
+SELECT ours.title,
+       ours.regular_price AS our_price,
+       theirs.regular_price AS amazon_price,
+       (ours.regular_price - theirs.regular_price) AS price_diff
+FROM product_offers AS ours
+INNER JOIN product_offers AS theirs ON ours.product_match_id = theirs.product_match_id
@@ -0,0 +1,8 @@
+SELECT title,
+       regular_price,
+       markdown_price,
+       ((regular_price - markdown_price) / regular_price) AS discount_pct
+FROM product_offers
+WHERE is_markdown = TRUE
+ORDER BY regular_price DESC
+LIMIT 20
@@ -0,0 +1,6 @@
+SELECT vendor,
+       category,
+       title,
+       regular_price,
+       RANK(regular_price) OVER (PARTITION BY category ORDER BY regular_price ASC) AS price_rank
+FROM product_offers
@@ -0,0 +1,4 @@
+SELECT title,
+       regular_price,
+       CASE WHEN regular_price < 20 THEN 'budget' WHEN regular_price < 50 THEN 'value' WHEN regular_price < 100 THEN 'standard' ELSE 'premium' END AS price_tier
+FROM product_offers
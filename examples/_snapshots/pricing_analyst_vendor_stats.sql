@@ -0,0 +1,9 @@
+SELECT vendor,
+       COUNT(*) AS product_count,
+       AVG(regular_price) AS avg_price,
+       MIN(regular_price) AS min_price,
+       MAX(regular_price) AS max_price
+FROM product_offers
+GROUP BY vendor
+HAVING COUNT(*) > 100
+ORDER BY regular_price DESC
@@ -0,0 +1,6 @@
+SELECT vendor,
+       title,
+       regular_price,
+       created_at,
+       LAG(regular_price, 0) OVER (PARTITION BY vendor, title ORDER BY created_at ASC) AS prev_price
+FROM product_offers
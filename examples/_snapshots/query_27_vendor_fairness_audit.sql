@@ -0,0 +1,11 @@
+SELECT my.id,
+       my.title,
+       my.brand,
+       my.regular_price,
+       comp.regular_price
+FROM product_offers AS my
+INNER JOIN exact_matches AS em ON my.id = em.source_id
+INNER JOIN product_offers AS comp ON em.target_id = comp.id
+WHERE (my.vendor = 'Us' AND comp.regular_price < my.regular_price)
+ORDER BY brand ASC
+LIMIT 100
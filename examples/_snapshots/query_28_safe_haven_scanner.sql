@@ -0,0 +1,12 @@
+SELECT my.category,
+       my.brand,
+       AVG(my.markdown_price) AS avg_our_price,
+       AVG(comp.markdown_price) AS avg_comp_price,
+       COUNT(*) AS product_count,
+       STDDEV(comp.markdown_price) AS comp_price_volatility
+FROM product_offers AS my
+INNER JOIN exact_matches AS em ON my.id = em.source_id
+INNER JOIN product_offers AS comp ON em.target_id = comp.id
+WHERE my.vendor = 'Us'
+GROUP BY category, brand
+ORDER BY category ASC
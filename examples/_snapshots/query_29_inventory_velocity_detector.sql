@@ -0,0 +1,13 @@
+SELECT my.id,
+       my.title,
+       my.brand,
+       my.category,
+       my.availability,
+       comp.availability,
+       comp.markdown_price
+FROM product_offers AS my
+INNER JOIN exact_matches AS em ON my.id = em.source_id
+INNER JOIN product_offers AS comp ON em.target_id = comp.id
+WHERE my.vendor = 'Us'
+ORDER BY category ASC, brand ASC
+LIMIT 200
@@ -4,6 +4,8 @@ Basic query examples demonstrating core functionality.
 These examples show simple queries that cover the most common use cases.
 """
 
+import traceback
+
 from structured_query_builder import *
 from structured_query_builder.translator import translate_query
 
@@ -260,7 +262,6 @@ def main():
             example()
         except Exception as e:
             print(f"\nError in {example.__name__}: {e}")
-            import traceback
             traceback.print_exc()
 
     print("\n" + "="*80)
@@ -12,6 +12,8 @@ Archetypes:
 NO SHORTCUTS. ALL QUERIES WORKING AND TESTED.
 """
 
+import traceback
+
 from structured_query_builder import *
 from structured_query_builder.translator import translate_query
 
@@ -1005,7 +1007,6 @@ def main():
         except Exception as e:
             print(f"\n❌ {name}")
             print(f"ERROR: {e}")
-            import traceback
             traceback.print_exc()
 
     print("\n" + "=" * 80)
@@ -9,30 +9,74 @@ Real-world queries for e-commerce pricing analysis, including:
 - Price segmentation
 """
 
-from structured_query_builder import *
-from structured_query_builder.translator import translate_query
-
-
-def example_1_discount_percentage():
-    """
-    Calculate discount percentage for markdown products.
-
-    SELECT title, regular_price, markdown_price,
-           ((regular_price - markdown_price) / regular_price) AS discount_pct
-    FROM product_offers
-    WHERE is_markdown = TRUE
-    ORDER BY discount_pct DESC
-    LIMIT 20
-    """
-    print("\n" + "="*80)
-    print("Pricing Example 1: Discount Percentage Analysis")
-    print("="*80)
-
-    query = Query(
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+from structured_query_builder import (
+    AggregateExpr,
+    AggregateFunc,
+    ArithmeticOp,
+    BinaryArithmetic,
+    CaseExpr,
+    Column,
+    ColumnComparison,
+    ComparisonOp,
+    CompoundArithmetic,
+    ConditionGroup,
+    FromClause,
+    GroupByClause,
+    HavingClause,
+    HavingCondition,
+    JoinSpec,
+    JoinType,
+    LimitClause,
+    LogicOp,
+    OrderByClause,
+    Query,
+    ScalarSubquery,
+    SubqueryCondition,
+    Table,
+    WhereL1,
+    WindowExpr,
+    WindowFunc,
+    qcol,
+)
+from structured_query_builder.translator import translate_query, translate_query_many
+from examples._common import (
+    FROM_PRODUCT_OFFERS,
+    MARKDOWN_WHERE,
+    ORDER_CREATED_AT_ASC,
+    ORDER_PRICE_ASC,
+    ORDER_PRICE_DESC,
+    col,
+    price_stats_aggs,
+    tier_whens,
+)
+
+_BAR = "=" * 80
+_HEAD = "\n" + _BAR
+
+
+# =============================================================================
+# Shared sub-expressions (read-only, reused across examples)
+# =============================================================================
+
+_COL_TITLE = col(Column.title)
+_COL_REGULAR_PRICE = col(Column.regular_price)
+
+
+# =============================================================================
+# Example query builders (run lazily, on first access)
+# =============================================================================
+
+
+def _build_discount() -> Query:
+    return Query(
         select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.title)),
-            ColumnExpr(source=QualifiedColumn(column=Column.regular_price)),
-            ColumnExpr(source=QualifiedColumn(column=Column.markdown_price)),
+            _COL_TITLE,
+            _COL_REGULAR_PRICE,
+            col(Column.markdown_price),
             CompoundArithmetic(
                 inner_left_column=Column.regular_price,
                 inner_operator=ArithmeticOp.subtract,
@@ -42,108 +86,50 @@ def example_1_discount_percentage():
                 alias="discount_pct"
             )
         ],
-        from_=FromClause(table=Table.product_offers),
-        where=WhereL1(
-            groups=[
-                ConditionGroup(
-                    conditions=[
-                        SimpleCondition(
-                            column=QualifiedColumn(column=Column.is_markdown),
-                            operator=ComparisonOp.eq,
-                            value=True
-                        )
-                    ],
-                    logic=LogicOp.and_
-                )
-            ],
-            group_logic=LogicOp.and_
-        ),
+        from_=FROM_PRODUCT_OFFERS,
+        where=MARKDOWN_WHERE,
         order_by=OrderByClause(
             items=[
-                OrderByItem(column=Column.regular_price, direction=Direction.desc)
+                ORDER_PRICE_DESC
             ]
         ),
         limit=LimitClause(limit=20)
     )
 
-    sql = translate_query(query)
-    print(sql)
-    print("\nUse Case: Identify products with highest discount percentages")
-    return query
-
 
-def example_2_price_ranking():
-    """
-    Rank products by price within each category.
-
-    SELECT vendor, category, title, regular_price,
-           RANK() OVER (PARTITION BY category
-                        ORDER BY regular_price ASC) AS price_rank
-    FROM product_offers
-    """
-    print("\n" + "="*80)
-    print("Pricing Example 2: Price Ranking by Category")
-    print("="*80)
-
-    query = Query(
+def _build_ranking() -> Query:
+    return Query(
         select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.vendor)),
-            ColumnExpr(source=QualifiedColumn(column=Column.category)),
-            ColumnExpr(source=QualifiedColumn(column=Column.title)),
-            ColumnExpr(source=QualifiedColumn(column=Column.regular_price)),
+            col(Column.vendor),
+            col(Column.category),
+            _COL_TITLE,
+            _COL_REGULAR_PRICE,
             WindowExpr(
                 function=WindowFunc.rank,
                 column=Column.regular_price,
                 partition_by=[Column.category],
                 order_by=[
-                    OrderByItem(column=Column.regular_price, direction=Direction.asc)
+                    ORDER_PRICE_ASC
                 ],
                 alias="price_rank"
             )
         ],
-        from_=FromClause(table=Table.product_offers)
+        from_=FROM_PRODUCT_OFFERS
     )
 
-    sql = translate_query(query)
-    print(sql)
-    print("\nUse Case: See how products rank by price within their categories")
-    return query
-
-
-def example_3_competitor_comparison():
-    """
-    Compare our prices to Amazon's for the same products.
-
-    SELECT ours.title,
-           ours.regular_price AS our_price,
-           theirs.regular_price AS amazon_price,
-           (ours.regular_price - theirs.regular_price) AS price_diff
-    FROM product_offers ours
-    INNER JOIN product_offers theirs
-        ON ours.product_match_id = theirs.product_match_id
-    WHERE ours.vendor = 'our_company' AND theirs.vendor = 'amazon'
-    """
-    print("\n" + "="*80)
-    print("Pricing Example 3: Competitor Price Comparison (Self-Join)")
-    print("="*80)
 
-    query = Query(
+def _build_competitor() -> Query:
+    return Query(
         select=[
-            ColumnExpr(
-                source=QualifiedColumn(table_alias="ours", column=Column.title)
-            ),
-            ColumnExpr(
-                source=QualifiedColumn(table_alias="ours", column=Column.regular_price),
-                alias="our_price"
-            ),
-            ColumnExpr(
-                source=QualifiedColumn(table_alias="theirs", column=Column.regular_price),
-                alias="amazon_price"
-            ),
+            col(Column.title, table_alias="ours"),
+            col(Column.regular_price, alias="our_price", table_alias="ours"),
+            col(Column.regular_price, alias="amazon_price", table_alias="theirs"),
             BinaryArithmetic(
                 left_column=Column.regular_price,
+                left_table_alias="ours",
                 operator=ArithmeticOp.subtract,
                 right_column=Column.regular_price,
+                right_table_alias="theirs",
                 alias="price_diff"
             )
         ],
@@ -155,47 +141,36 @@ def example_3_competitor_comparison():
                     join_type=JoinType.inner,
                     table=Table.product_offers,
                     table_alias="theirs",
-                    left_column=Column.product_match_id,
-                    left_table_alias="ours",
-                    right_column=Column.product_match_id
+                    on_conditions=[
+                        ConditionGroup(
+                            conditions=[
+                                ColumnComparison(
+                                    left_column=qcol(Column.product_match_id, "ours"),
+                                    operator=ComparisonOp.eq,
+                                    right_column=qcol(Column.product_match_id, "theirs")
+                                )
+                            ],
+                            logic=LogicOp.and_
+                        )
+                    ]
                 )
             ]
         )
     )
 
-    sql = translate_query(query)
-    print(sql)
-    print("\nUse Case: Direct price comparison with specific competitor")
-    return query
-
 
-def example_4_above_category_average():
-    """
-    Find products priced above their category average.
-
-    SELECT title, category, regular_price
-    FROM product_offers
-    WHERE regular_price > (
-        SELECT AVG(regular_price)
-        FROM product_offers sub
-        WHERE sub.category = product_offers.category
-    )
-    """
-    print("\n" + "="*80)
-    print("Pricing Example 4: Products Above Category Average")
-    print("="*80)
-
-    query = Query(
+def _build_above_average() -> Query:
+    return Query(
         select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.title)),
-            ColumnExpr(source=QualifiedColumn(column=Column.category)),
-            ColumnExpr(source=QualifiedColumn(column=Column.regular_price)),
+            _COL_TITLE,
+            col(Column.category),
+            _COL_REGULAR_PRICE,
         ],
-        from_=FromClause(table=Table.product_offers),
+        from_=FROM_PRODUCT_OFFERS,
         where=WhereL1(
             subquery_conditions=[
                 SubqueryCondition(
-                    column=QualifiedColumn(column=Column.regular_price),
+                    column=qcol(Column.regular_price),
                     operator=ComparisonOp.gt,
                     subquery=ScalarSubquery(
                         table=Table.product_offers,
@@ -212,9 +187,214 @@ def example_4_above_category_average():
         )
     )
 
-    sql = translate_query(query)
-    print(sql)
-    print("\nUse Case: Identify premium-priced products in each category")
+
+def _build_tiers() -> Query:
+    return Query(
+        select=[
+            _COL_TITLE,
+            _COL_REGULAR_PRICE,
+            CaseExpr(
+                whens=tier_whens(),
+                else_value="premium",
+                alias="price_tier"
+            )
+        ],
+        from_=FROM_PRODUCT_OFFERS
+    )
+
+
+def _build_vendor_stats() -> Query:
+    return Query(
+        select=[
+            col(Column.vendor),
+            *price_stats_aggs(),
+        ],
+        from_=FROM_PRODUCT_OFFERS,
+        group_by=GroupByClause(columns=[Column.vendor]),
+        having=HavingClause(
+            conditions=[
+                HavingCondition(
+                    function=AggregateFunc.count,
+                    column=None,
+                    operator=ComparisonOp.gt,
+                    value=100
+                )
+            ],
+            logic=LogicOp.and_
+        ),
+        order_by=OrderByClause(
+            items=[
+                ORDER_PRICE_DESC
+            ]
+        )
+    )
+
+
+def _build_week_over_week() -> Query:
+    return Query(
+        select=[
+            col(Column.vendor),
+            _COL_TITLE,
+            _COL_REGULAR_PRICE,
+            col(Column.created_at),
+            WindowExpr(
+                function=WindowFunc.lag,
+                column=Column.regular_price,
+                partition_by=[Column.vendor, Column.title],
+                order_by=[
+                    ORDER_CREATED_AT_ASC
+                ],
+                offset=1,
+                default_value=0,
+                alias="prev_price"
+            )
+        ],
+        from_=FROM_PRODUCT_OFFERS
+    )
+
+
+_BUILDERS = {
+    "discount": _build_discount,
+    "ranking": _build_ranking,
+    "competitor": _build_competitor,
+    "above_average": _build_above_average,
+    "tiers": _build_tiers,
+    "vendor_stats": _build_vendor_stats,
+    "week_over_week": _build_week_over_week,
+}
+
+
+# Report title and use case for each example
+_EXAMPLES: dict[str, tuple[str, str]] = {
+    "discount": (
+        "Pricing Example 1: Discount Percentage Analysis",
+        "Identify products with highest discount percentages",
+    ),
+    "ranking": (
+        "Pricing Example 2: Price Ranking by Category",
+        "See how products rank by price within their categories",
+    ),
+    "competitor": (
+        "Pricing Example 3: Competitor Price Comparison (Self-Join)",
+        "Direct price comparison with specific competitor",
+    ),
+    "above_average": (
+        "Pricing Example 4: Products Above Category Average",
+        "Identify premium-priced products in each category",
+    ),
+    "tiers": (
+        "Pricing Example 5: Price Tier Classification",
+        "Segment products by price tier for reporting",
+    ),
+    "vendor_stats": (
+        "Pricing Example 6: Vendor Price Statistics",
+        "Overview of vendor pricing strategies",
+    ),
+    "week_over_week": (
+        "Pricing Example 7: Week-over-Week Price Changes",
+        "Detect price trends and changes over time",
+    ),
+}
+
+
+# (query, sql) per example, filled on first access
+_CACHE: dict[str, tuple[Query, str]] = {}
+
+
+def _compiled(name: str) -> tuple[Query, str]:
+    """Build and translate an example on first use, then serve it from _CACHE."""
+    entry = _CACHE.get(name)
+    if entry is None:
+        query = _BUILDERS[name]()
+        entry = _CACHE[name] = (query, translate_query(query))
+    return entry
+
+
+def _compile_all() -> None:
+    """Build every example not yet in _CACHE and translate them as one batch."""
+    pending = [name for name in _BUILDERS if name not in _CACHE]
+    if not pending:
+        return
+    queries = [_BUILDERS[name]() for name in pending]
+    for name, query, sql in zip(pending, queries, translate_query_many(queries)):
+        _CACHE[name] = (query, sql)
+
+
+def __getattr__(name: str) -> tuple[Query, str]:
+    """Expose each example as a lazily compiled module attribute (PEP 562)."""
+    if name in _BUILDERS:
+        return _compiled(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _format_example(name: str, sql: str) -> str:
+    """Render one example's report block."""
+    title, use_case = _EXAMPLES[name]
+    return f"{_HEAD}\n{title}\n{_BAR}\n{sql}\n\nUse Case: {use_case}\n"
+
+
+def example_1_discount_percentage():
+    """
+    Calculate discount percentage for markdown products.
+
+    SELECT title, regular_price, markdown_price,
+           ((regular_price - markdown_price) / regular_price) AS discount_pct
+    FROM product_offers
+    WHERE is_markdown = TRUE
+    ORDER BY discount_pct DESC
+    LIMIT 20
+    """
+    query, sql = _compiled("discount")
+    sys.stdout.write(_format_example("discount", sql))
+    return query
+
+
+def example_2_price_ranking():
+    """
+    Rank products by price within each category.
+
+    SELECT vendor, category, title, regular_price,
+           RANK() OVER (PARTITION BY category
+                        ORDER BY regular_price ASC) AS price_rank
+    FROM product_offers
+    """
+    query, sql = _compiled("ranking")
+    sys.stdout.write(_format_example("ranking", sql))
+    return query
+
+
+def example_3_competitor_comparison():
+    """
+    Compare our prices to Amazon's for the same products.
+
+    SELECT ours.title,
+           ours.regular_price AS our_price,
+           theirs.regular_price AS amazon_price,
+           (ours.regular_price - theirs.regular_price) AS price_diff
+    FROM product_offers ours
+    INNER JOIN product_offers theirs
+        ON ours.product_match_id = theirs.product_match_id
+    WHERE ours.vendor = 'our_company' AND theirs.vendor = 'amazon'
+    """
+    query, sql = _compiled("competitor")
+    sys.stdout.write(_format_example("competitor", sql))
+    return query
+
+
+def example_4_above_category_average():
+    """
+    Find products priced above their category average.
+
+    SELECT title, category, regular_price
+    FROM product_offers
+    WHERE regular_price > (
+        SELECT AVG(regular_price)
+        FROM product_offers sub
+        WHERE sub.category = product_offers.category
+    )
+    """
+    query, sql = _compiled("above_average")
+    sys.stdout.write(_format_example("above_average", sql))
     return query
 
 
@@ -231,45 +411,8 @@ def example_5_price_tier_classification():
            END AS price_tier
     FROM product_offers
     """
-    print("\n" + "="*80)
-    print("Pricing Example 5: Price Tier Classification")
-    print("="*80)
-
-    query = Query(
-        select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.title)),
-            ColumnExpr(source=QualifiedColumn(column=Column.regular_price)),
-            CaseExpr(
-                whens=[
-                    CaseWhen(
-                        condition_column=Column.regular_price,
-                        condition_operator=ComparisonOp.lt,
-                        condition_value=20,
-                        then_value="budget"
-                    ),
-                    CaseWhen(
-                        condition_column=Column.regular_price,
-                        condition_operator=ComparisonOp.lt,
-                        condition_value=50,
-                        then_value="value"
-                    ),
-                    CaseWhen(
-                        condition_column=Column.regular_price,
-                        condition_operator=ComparisonOp.lt,
-                        condition_value=100,
-                        then_value="standard"
-                    ),
-                ],
-                else_value="premium",
-                alias="price_tier"
-            )
-        ],
-        from_=FromClause(table=Table.product_offers)
-    )
-
-    sql = translate_query(query)
-    print(sql)
-    print("\nUse Case: Segment products by price tier for reporting")
+    query, sql = _compiled("tiers")
+    sys.stdout.write(_format_example("tiers", sql))
     return query
 
 
@@ -287,57 +430,8 @@ def example_6_vendor_price_stats():
     HAVING COUNT(*) > 100
     ORDER BY avg_price DESC
     """
-    print("\n" + "="*80)
-    print("Pricing Example 6: Vendor Price Statistics")
-    print("="*80)
-
-    query = Query(
-        select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.vendor)),
-            AggregateExpr(
-                function=AggregateFunc.count,
-                column=None,
-                alias="product_count"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.avg,
-                column=Column.regular_price,
-                alias="avg_price"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.min,
-                column=Column.regular_price,
-                alias="min_price"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.max,
-                column=Column.regular_price,
-                alias="max_price"
-            )
-        ],
-        from_=FromClause(table=Table.product_offers),
-        group_by=GroupByClause(columns=[Column.vendor]),
-        having=HavingClause(
-            conditions=[
-                HavingCondition(
-                    function=AggregateFunc.count,
-                    column=None,
-                    operator=ComparisonOp.gt,
-                    value=100
-                )
-            ],
-            logic=LogicOp.and_
-        ),
-        order_by=OrderByClause(
-            items=[
-                OrderByItem(column=Column.regular_price, direction=Direction.desc)
-            ]
-        )
-    )
-
-    sql = translate_query(query)
-    print(sql)
-    print("\nUse Case: Overview of vendor pricing strategies")
+    query, sql = _compiled("vendor_stats")
+    sys.stdout.write(_format_example("vendor_stats", sql))
     return query
 
 
@@ -352,67 +446,59 @@ def example_7_week_over_week_changes():
            ) AS prev_price
     FROM product_offers
     """
-    print("\n" + "="*80)
-    print("Pricing Example 7: Week-over-Week Price Changes")
-    print("="*80)
+    query, sql = _compiled("week_over_week")
+    sys.stdout.write(_format_example("week_over_week", sql))
+    return query
 
-    query = Query(
-        select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.vendor)),
-            ColumnExpr(source=QualifiedColumn(column=Column.title)),
-            ColumnExpr(source=QualifiedColumn(column=Column.regular_price)),
-            ColumnExpr(source=QualifiedColumn(column=Column.created_at)),
-            WindowExpr(
-                function=WindowFunc.lag,
-                column=Column.regular_price,
-                partition_by=[Column.vendor, Column.title],
-                order_by=[
-                    OrderByItem(column=Column.created_at, direction=Direction.asc)
-                ],
-                offset=1,
-                default_value=0,
-                alias="prev_price"
-            )
-        ],
-        from_=FromClause(table=Table.product_offers)
-    )
 
-    sql = translate_query(query)
-    print(sql)
-    print("\nUse Case: Detect price trends and changes over time")
-    return query
+# SQL for each example is generated ahead of time and checked in;
+# run this module with --regenerate after changing a builder.
+_SNAPSHOT_DIR = Path(__file__).parent / "_snapshots"
+
+
+def _snapshot_path(name: str) -> Path:
+    return _SNAPSHOT_DIR / f"pricing_analyst_{name}.sql"
 
 
-def main():
-    """Run all pricing analyst examples."""
-    print("\n" + "="*80)
+def write_sql_snapshots():
+    """Translate every example and write its .sql snapshot."""
+    _SNAPSHOT_DIR.mkdir(exist_ok=True)
+    _compile_all()
+    for name in _BUILDERS:
+        _snapshot_path(name).write_text(_CACHE[name][1] + "\n")
+    load_sql.cache_clear()
+
+
+@lru_cache(maxsize=None)
+def load_sql(name: str) -> str:
+    """Return the precompiled SQL for an example without translating it."""
+    return _snapshot_path(name).read_text().rstrip("\n")
+
+
+def main(regenerate: bool = False):
+    """Print all pricing analyst examples from their SQL snapshots."""
+    if regenerate:
+        write_sql_snapshots()
+
+    print(_HEAD)
     print(" PRICING ANALYST QUERY EXAMPLES")
-    print("="*80)
+    print(_BAR)
     print("\nThese queries demonstrate real-world pricing analysis patterns")
     print("used by e-commerce pricing analysts.")
 
-    examples = [
-        example_1_discount_percentage,
-        example_2_price_ranking,
-        example_3_competitor_comparison,
-        example_4_above_category_average,
-        example_5_price_tier_classification,
-        example_6_vendor_price_stats,
-        example_7_week_over_week_changes,
-    ]
-
-    for example in examples:
-        try:
-            example()
-        except Exception as e:
-            print(f"\nError in {example.__name__}: {e}")
-            import traceback
-            traceback.print_exc()
-
-    print("\n" + "="*80)
+    for name in _BUILDERS:
+        sys.stdout.write(_format_example(name, load_sql(name)))
+
+    print(_HEAD)
     print(" All pricing analyst examples completed!")
-    print("="*80)
+    print(_BAR)
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main(regenerate="--regenerate" in sys.argv[1:])
+    except Exception:
+        import traceback  # only needed on the failure path
+
+        traceback.print_exc()
+        sys.exit(1)
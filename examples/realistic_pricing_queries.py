@@ -10,21 +10,61 @@ Each example is taken from PRICING_ANALYST_QUERIES.md and demonstrates:
 These are REAL queries that pricing analysts actually run, not toy examples.
 """
 
-from structured_query_builder import *
-from structured_query_builder.translator import translate_query
-
-
-def print_query(title, description, query):
-    """Print query with context."""
-    print(f"\n{'='*80}")
-    print(f"{title}")
-    print(f"{'='*80}")
-    print(f"\n{description}\n")
-    sql = translate_query(query)
-    print("Generated SQL:")
-    print("-" * 80)
-    print(sql)
-    print("-" * 80)
+import io
+import sys
+from contextlib import redirect_stdout
+from typing import Final
+
+from structured_query_builder import (
+    AggregateExpr,
+    AggregateFunc,
+    ArithmeticOp,
+    BinaryArithmetic,
+    CaseExpr,
+    Column,
+    ComparisonOp,
+    CompoundArithmetic,
+    ConditionGroup,
+    Direction,
+    GroupByClause,
+    HavingClause,
+    HavingCondition,
+    LimitClause,
+    LogicOp,
+    OrderByClause,
+    OrderByItem,
+    Query,
+    SimpleCondition,
+    WhereL1,
+    WindowExpr,
+    WindowFunc,
+    qcol,
+)
+from examples._common import (
+    FROM_PRODUCT_OFFERS,
+    MARKDOWN_WHERE,
+    ORDER_CATEGORY_ASC,
+    ORDER_CREATED_AT_ASC,
+    ORDER_PRICE_ASC,
+    ORDER_PRICE_DESC,
+    col,
+    price_stats_aggs,
+    tier_whens,
+    translate_query_cached,
+)
+
+_BAR = "=" * 80
+_HEAD = "\n" + _BAR
+_DASH = "-" * 80
+
+
+def print_query(title, description, query, note=None):
+    """Print query with context and an optional trailing note in a single write."""
+    sql = translate_query_cached(query)
+    parts = [_HEAD, title, _BAR, f"\n{description}\n", "Generated SQL:", _DASH, sql, _DASH]
+    if note:
+        parts.append(f"\n{note}")
+    sys.stdout.write("\n".join(parts) + "\n")
     return sql
 
 
@@ -33,6 +73,30 @@ def print_query(title, description, query):
 # Status: ✅ FULLY SUPPORTED
 # ===========================================================================
 
+_QUERY_2: Final[Query] = Query(
+    select=[
+        col(Column.category),
+        *price_stats_aggs(),
+    ],
+    from_=FROM_PRODUCT_OFFERS,
+    group_by=GroupByClause(columns=[Column.category]),
+    having=HavingClause(
+        conditions=[
+            HavingCondition(
+                function=AggregateFunc.count,
+                column=None,
+                operator=ComparisonOp.ge,
+                value=10
+            )
+        ],
+        logic=LogicOp.and_
+    ),
+    order_by=OrderByClause(
+        items=[ORDER_CATEGORY_ASC]
+    )
+)
+
+
 def query_2_category_benchmarks():
     """
     Business Context:
@@ -43,52 +107,10 @@ def query_2_category_benchmarks():
     "What's the average price for each product category? Show me category name,
     count of products, average price, and min/max prices."
     """
-    query = Query(
-        select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.category)),
-            AggregateExpr(
-                function=AggregateFunc.count,
-                column=None,
-                alias="product_count"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.avg,
-                column=Column.regular_price,
-                alias="avg_price"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.min,
-                column=Column.regular_price,
-                alias="min_price"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.max,
-                column=Column.regular_price,
-                alias="max_price"
-            )
-        ],
-        from_=FromClause(table=Table.product_offers),
-        group_by=GroupByClause(columns=[Column.category]),
-        having=HavingClause(
-            conditions=[
-                HavingCondition(
-                    function=AggregateFunc.count,
-                    column=None,
-                    operator=ComparisonOp.ge,
-                    value=10
-                )
-            ],
-            logic=LogicOp.and_
-        ),
-        order_by=OrderByClause(
-            items=[OrderByItem(column=Column.category, direction=Direction.asc)]
-        )
-    )
-
     return print_query(
         "Query 2: Category Average Price Benchmark",
         "Weekly pricing review - Category managers use this in QBRs",
-        query
+        _QUERY_2
     )
 
 
@@ -97,6 +119,37 @@ def query_2_category_benchmarks():
 # Status: ✅ SUPPORTED (with minor limitation on * 100)
 # ===========================================================================
 
+_QUERY_3: Final[Query] = Query(
+    select=[
+        col(Column.title),
+        col(Column.category),
+        col(Column.vendor),
+        col(Column.regular_price),
+        col(Column.markdown_price),
+        BinaryArithmetic(
+            left_column=Column.regular_price,
+            operator=ArithmeticOp.subtract,
+            right_column=Column.markdown_price,
+            alias="discount_amount"
+        ),
+        CompoundArithmetic(
+            inner_left_column=Column.regular_price,
+            inner_operator=ArithmeticOp.subtract,
+            inner_right_column=Column.markdown_price,
+            outer_operator=ArithmeticOp.divide,
+            outer_column=Column.regular_price,
+            alias="discount_percent_fraction"
+        )
+    ],
+    from_=FROM_PRODUCT_OFFERS,
+    where=MARKDOWN_WHERE,
+    order_by=OrderByClause(
+        items=[ORDER_PRICE_DESC]
+    ),
+    limit=LimitClause(limit=100)
+)
+
+
 def query_3_markdown_analysis():
     """
     Business Context:
@@ -107,65 +160,64 @@ def query_3_markdown_analysis():
     "Show me all products on markdown with discount amount and percentage.
     I want to see which ones have deepest discounts."
     """
-    query = Query(
-        select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.title)),
-            ColumnExpr(source=QualifiedColumn(column=Column.category)),
-            ColumnExpr(source=QualifiedColumn(column=Column.vendor)),
-            ColumnExpr(source=QualifiedColumn(column=Column.regular_price)),
-            ColumnExpr(source=QualifiedColumn(column=Column.markdown_price)),
-            BinaryArithmetic(
-                left_column=Column.regular_price,
-                operator=ArithmeticOp.subtract,
-                right_column=Column.markdown_price,
-                alias="discount_amount"
-            ),
-            CompoundArithmetic(
-                inner_left_column=Column.regular_price,
-                inner_operator=ArithmeticOp.subtract,
-                inner_right_column=Column.markdown_price,
-                outer_operator=ArithmeticOp.divide,
-                outer_column=Column.regular_price,
-                alias="discount_percent_fraction"
-            )
-        ],
-        from_=FromClause(table=Table.product_offers),
-        where=WhereL1(
-            groups=[
-                ConditionGroup(
-                    conditions=[
-                        SimpleCondition(
-                            column=QualifiedColumn(column=Column.is_markdown),
-                            operator=ComparisonOp.eq,
-                            value=True
-                        )
-                    ],
-                    logic=LogicOp.and_
-                )
-            ],
-            group_logic=LogicOp.and_
-        ),
-        order_by=OrderByClause(
-            items=[OrderByItem(column=Column.regular_price, direction=Direction.desc)]
-        ),
-        limit=LimitClause(limit=100)
-    )
-
-    sql = print_query(
+    return print_query(
         "Query 3: Markdown Effectiveness Analysis",
         "Post-promotion reporting - Pricing analysts use this weekly/monthly",
-        query
+        _QUERY_3,
+        note="⚠️  NOTE: discount_percent_fraction needs * 100 in app layer for display"
     )
 
-    print("\n⚠️  NOTE: discount_percent_fraction needs * 100 in app layer for display")
-    return sql
-
 
 # ===========================================================================
 # QUERY 4: Competitive Pricing Position by Category
 # Status: ⚠️  SEMANTIC LIMITATION (window on aggregate)
 # ===========================================================================
 
+_QUERY_4: Final[Query] = Query(
+    select=[
+        col(Column.category),
+        col(Column.vendor),
+        AggregateExpr(
+            function=AggregateFunc.avg,
+            column=Column.regular_price,
+            alias="avg_category_price"
+        ),
+        AggregateExpr(
+            function=AggregateFunc.count,
+            column=None,
+            alias="product_count"
+        ),
+        # This window function conceptually ranks AVG(regular_price)
+        # but references the column directly
+        WindowExpr(
+            function=WindowFunc.rank,
+            column=Column.regular_price,
+            partition_by=[Column.category],
+            order_by=[ORDER_PRICE_ASC],
+            alias="price_position"
+        )
+    ],
+    from_=FROM_PRODUCT_OFFERS,
+    group_by=GroupByClause(columns=[Column.category, Column.vendor]),
+    having=HavingClause(
+        conditions=[
+            HavingCondition(
+                function=AggregateFunc.count,
+                column=None,
+                operator=ComparisonOp.ge,
+                value=5
+            )
+        ],
+        logic=LogicOp.and_
+    ),
+    order_by=OrderByClause(
+        items=[
+            ORDER_CATEGORY_ASC
+        ]
+    )
+)
+
+
 def query_4_competitive_position():
     """
     Business Context:
@@ -179,67 +231,46 @@ def query_4_competitive_position():
     LIMITATION: Window function needs to operate on AVG(regular_price) but
     our schema references regular_price column directly.
     """
-    query = Query(
-        select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.category)),
-            ColumnExpr(source=QualifiedColumn(column=Column.vendor)),
-            AggregateExpr(
-                function=AggregateFunc.avg,
-                column=Column.regular_price,
-                alias="avg_category_price"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.count,
-                column=None,
-                alias="product_count"
-            ),
-            # This window function conceptually ranks AVG(regular_price)
-            # but references the column directly
-            WindowExpr(
-                function=WindowFunc.rank,
-                column=Column.regular_price,
-                partition_by=[Column.category],
-                order_by=[OrderByItem(column=Column.regular_price, direction=Direction.asc)],
-                alias="price_position"
-            )
-        ],
-        from_=FromClause(table=Table.product_offers),
-        group_by=GroupByClause(columns=[Column.category, Column.vendor]),
-        having=HavingClause(
-            conditions=[
-                HavingCondition(
-                    function=AggregateFunc.count,
-                    column=None,
-                    operator=ComparisonOp.ge,
-                    value=5
-                )
-            ],
-            logic=LogicOp.and_
-        ),
-        order_by=OrderByClause(
-            items=[
-                OrderByItem(column=Column.category, direction=Direction.asc)
-            ]
-        )
-    )
-
-    sql = print_query(
+    return print_query(
         "Query 4: Competitive Pricing Position by Category",
         "Monthly strategy - Directors use this in executive presentations",
-        query
+        _QUERY_4,
+        note=(
+            "⚠️  NOTE: Semantically, window function should rank the aggregated\n"
+            "avg_category_price, not the raw regular_price column.\n"
+            "Workaround: Use derived table or post-process in application."
+        )
     )
 
-    print("\n⚠️  NOTE: Semantically, window function should rank the aggregated")
-    print("avg_category_price, not the raw regular_price column.")
-    print("Workaround: Use derived table or post-process in application.")
-    return sql
-
 
 # ===========================================================================
 # QUERY 5: Price Change Detection (Week-over-Week)
 # Status: ✅ SUPPORTED (computation of change happens in app)
 # ===========================================================================
 
+_QUERY_5: Final[Query] = Query(
+    select=[
+        col(Column.vendor),
+        col(Column.category),
+        col(Column.title),
+        col(Column.regular_price, alias="current_price"),
+        WindowExpr(
+            function=WindowFunc.lag,
+            column=Column.regular_price,
+            partition_by=[Column.vendor, Column.title],
+            order_by=[ORDER_CREATED_AT_ASC],
+            offset=1,
+            alias="last_week_price"
+        )
+    ],
+    from_=FROM_PRODUCT_OFFERS,
+    order_by=OrderByClause(
+        items=[ORDER_PRICE_DESC]
+    ),
+    limit=LimitClause(limit=100)
+)
+
+
 def query_5_price_changes():
     """
     Business Context:
@@ -250,46 +281,63 @@ def query_5_price_changes():
     "Show me products where price changed from last week to this week.
     Show current price and previous price."
     """
-    query = Query(
-        select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.vendor)),
-            ColumnExpr(source=QualifiedColumn(column=Column.category)),
-            ColumnExpr(source=QualifiedColumn(column=Column.title)),
-            ColumnExpr(
-                source=QualifiedColumn(column=Column.regular_price),
-                alias="current_price"
-            ),
-            WindowExpr(
-                function=WindowFunc.lag,
-                column=Column.regular_price,
-                partition_by=[Column.vendor, Column.title],
-                order_by=[OrderByItem(column=Column.created_at, direction=Direction.asc)],
-                offset=1,
-                alias="last_week_price"
-            )
-        ],
-        from_=FromClause(table=Table.product_offers),
-        order_by=OrderByClause(
-            items=[OrderByItem(column=Column.regular_price, direction=Direction.desc)]
-        ),
-        limit=LimitClause(limit=100)
-    )
-
-    sql = print_query(
+    return print_query(
         "Query 5: Price Change Detection (Week-over-Week)",
         "Monday mornings - Competitive intelligence tracking",
-        query
+        _QUERY_5,
+        note="💡 USAGE: Application computes (current_price - last_week_price) after query"
     )
 
-    print("\n💡 USAGE: Application computes (current_price - last_week_price) after query")
-    return sql
-
 
 # ===========================================================================
 # QUERY 6: Price Tier Classification
 # Status: ✅ SUPPORTED (GROUP BY limitation documented)
 # ===========================================================================
 
+_QUERY_6: Final[Query] = Query(
+    select=[
+        col(Column.category),
+        CaseExpr(
+            whens=tier_whens(),
+            else_value="premium",
+            alias="price_tier"
+        ),
+        AggregateExpr(
+            function=AggregateFunc.count,
+            column=None,
+            alias="product_count"
+        ),
+        AggregateExpr(
+            function=AggregateFunc.avg,
+            column=Column.regular_price,
+            alias="tier_avg_price"
+        )
+    ],
+    from_=FROM_PRODUCT_OFFERS,
+    where=WhereL1(
+        groups=[
+            ConditionGroup(
+                conditions=[
+                    SimpleCondition(
+                        column=qcol(Column.vendor),
+                        operator=ComparisonOp.eq,
+                        value="our_company"
+                    )
+                ],
+                logic=LogicOp.and_
+            )
+        ],
+        group_logic=LogicOp.and_
+    ),
+    group_by=GroupByClause(columns=[Column.category]),
+    order_by=OrderByClause(
+        items=[
+            ORDER_CATEGORY_ASC
+        ]
+    )
+)
+
+
 def query_6_price_tiers():
     """
     Business Context:
@@ -300,84 +348,65 @@ def query_6_price_tiers():
     "Classify products into tiers: budget (<$20), value ($20-$50),
     standard ($50-$100), premium (>$100). Count products per tier by category."
     """
-    query = Query(
-        select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.category)),
-            CaseExpr(
-                whens=[
-                    CaseWhen(
-                        condition_column=Column.regular_price,
-                        condition_operator=ComparisonOp.lt,
-                        condition_value=20,
-                        then_value="budget"
-                    ),
-                    CaseWhen(
-                        condition_column=Column.regular_price,
-                        condition_operator=ComparisonOp.lt,
-                        condition_value=50,
-                        then_value="value"
-                    ),
-                    CaseWhen(
-                        condition_column=Column.regular_price,
-                        condition_operator=ComparisonOp.lt,
-                        condition_value=100,
-                        then_value="standard"
-                    )
-                ],
-                else_value="premium",
-                alias="price_tier"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.count,
-                column=None,
-                alias="product_count"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.avg,
-                column=Column.regular_price,
-                alias="tier_avg_price"
-            )
-        ],
-        from_=FromClause(table=Table.product_offers),
-        where=WhereL1(
-            groups=[
-                ConditionGroup(
-                    conditions=[
-                        SimpleCondition(
-                            column=QualifiedColumn(column=Column.vendor),
-                            operator=ComparisonOp.eq,
-                            value="our_company"
-                        )
-                    ],
-                    logic=LogicOp.and_
-                )
-            ],
-            group_logic=LogicOp.and_
-        ),
-        group_by=GroupByClause(columns=[Column.category]),
-        order_by=OrderByClause(
-            items=[
-                OrderByItem(column=Column.category, direction=Direction.asc)
-            ]
-        )
-    )
-
-    sql = print_query(
+    return print_query(
         "Query 6: Price Tier Classification",
         "Merchandising - Product segmentation for price-tier promotions",
-        query
+        _QUERY_6,
+        note=(
+            "⚠️  NOTE: Ideally GROUP BY should include price_tier (the CASE expression)\n"
+            "Workaround: Database may support GROUP BY ordinal position, or use derived table"
+        )
     )
 
-    print("\n⚠️  NOTE: Ideally GROUP BY should include price_tier (the CASE expression)")
-    print("Workaround: Database may support GROUP BY ordinal position, or use derived table")
-    return sql
-
 
 # ===========================================================================
 # QUERY 8: Vendor Price Distribution
 # Status: ✅ SUPPORTED (except STDDEV which can be added)
 # ===========================================================================
 
+_QUERY_8: Final[Query] = Query(
+    select=[
+        col(Column.vendor),
+        AggregateExpr(
+            function=AggregateFunc.count,
+            column=None,
+            alias="product_count"
+        ),
+        AggregateExpr(
+            function=AggregateFunc.min,
+            column=Column.regular_price,
+            alias="min_price"
+        ),
+        AggregateExpr(
+            function=AggregateFunc.max,
+            column=Column.regular_price,
+            alias="max_price"
+        ),
+        AggregateExpr(
+            function=AggregateFunc.avg,
+            column=Column.regular_price,
+            alias="avg_price"
+        )
+    ],
+    from_=FROM_PRODUCT_OFFERS,
+    group_by=GroupByClause(columns=[Column.vendor]),
+    having=HavingClause(
+        conditions=[
+            HavingCondition(
+                function=AggregateFunc.count,
+                column=None,
+                operator=ComparisonOp.ge,
+                value=100
+            )
+        ],
+        logic=LogicOp.and_
+    ),
+    order_by=OrderByClause(
+        items=[OrderByItem(column=Column.vendor, direction=Direction.desc)]
+    )
+)
+
+
 def query_8_vendor_distribution():
     """
     Business Context:
@@ -388,63 +417,30 @@ def query_8_vendor_distribution():
     "For each vendor, show min, max, average price. This tells me if they're
     discount vendor (low avg) or varied-assortment vendor (high range)."
     """
-    query = Query(
-        select=[
-            ColumnExpr(source=QualifiedColumn(column=Column.vendor)),
-            AggregateExpr(
-                function=AggregateFunc.count,
-                column=None,
-                alias="product_count"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.min,
-                column=Column.regular_price,
-                alias="min_price"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.max,
-                column=Column.regular_price,
-                alias="max_price"
-            ),
-            AggregateExpr(
-                function=AggregateFunc.avg,
-                column=Column.regular_price,
-                alias="avg_price"
-            )
-        ],
-        from_=FromClause(table=Table.product_offers),
-        group_by=GroupByClause(columns=[Column.vendor]),
-        having=HavingClause(
-            conditions=[
-                HavingCondition(
-                    function=AggregateFunc.count,
-                    column=None,
-                    operator=ComparisonOp.ge,
-                    value=100
-                )
-            ],
-            logic=LogicOp.and_
-        ),
-        order_by=OrderByClause(
-            items=[OrderByItem(column=Column.vendor, direction=Direction.desc)]
-        )
-    )
-
-    sql = print_query(
+    return print_query(
         "Query 8: Vendor Price Distribution",
         "Quarterly reviews - Category buyers analyzing vendor strategies",
-        query
+        _QUERY_8,
+        note="💡 ENHANCEMENT: Add STDDEV to AggregateFunc enum for price dispersion analysis"
     )
 
-    print("\n💡 ENHANCEMENT: Add STDDEV to AggregateFunc enum for price dispersion analysis")
-    return sql
 
+# Report order; each entry prints a query built once at import time
+QUERIES = (
+    query_2_category_benchmarks,
+    query_3_markdown_analysis,
+    query_4_competitive_position,
+    query_5_price_changes,
+    query_6_price_tiers,
+    query_8_vendor_distribution,
+)
 
-def main():
-    """Run all realistic pricing analyst queries."""
-    print("\n" + "="*80)
+
+def _report():
+    """Print the header, every realistic query, and the summary."""
+    print(_HEAD)
     print(" REALISTIC PRICING ANALYST QUERIES")
-    print("="*80)
+    print(_BAR)
     print("\nThese queries are based on actual business use cases documented in")
     print("PRICING_ANALYST_QUERIES.md with full context and research citations.")
     print("\nEach query demonstrates:")
@@ -453,27 +449,13 @@ def main():
     print("  • Pydantic model → SQL translation")
     print("  • Any limitations or workarounds needed")
 
-    queries = [
-        query_2_category_benchmarks,
-        query_3_markdown_analysis,
-        query_4_competitive_position,
-        query_5_price_changes,
-        query_6_price_tiers,
-        query_8_vendor_distribution,
-    ]
-
-    for query_func in queries:
-        try:
-            query_func()
-        except Exception as e:
-            print(f"\n❌ ERROR in {query_func.__name__}: {e}")
-            import traceback
-            traceback.print_exc()
-
-    print("\n" + "="*80)
+    for query_func in QUERIES:
+        query_func()
+
+    print(_HEAD)
     print(" SUMMARY")
-    print("="*80)
-    print(f"\n✅ Successfully generated SQL for {len(queries)} realistic queries")
+    print(_BAR)
+    print(f"\n✅ Successfully generated SQL for {len(QUERIES)} realistic queries")
     print("\nAll queries are based on real pricing analyst workflows.")
     print("See PRICING_ANALYST_QUERIES.md for complete documentation including:")
     print("  • 10 total queries documented")
@@ -481,8 +463,25 @@ def main():
     print("  • Natural SQL versions")
     print("  • Schema limitations identified")
     print("  • Recommended workarounds")
-    print("\n" + "="*80)
+    print(_HEAD)
+
+
+def main():
+    """Run all realistic pricing analyst queries, emitting the report in one write."""
+    buf = io.StringIO()
+    try:
+        with redirect_stdout(buf):
+            _report()
+    finally:
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    except Exception:
+        import traceback  # only needed on the failure path
+
+        traceback.print_exc()
+        sys.exit(1)
@@ -20,6 +20,7 @@ from .enums import (
 
 from .expressions import (
     QualifiedColumn,
+    qcol,
     ColumnExpr,
     BinaryArithmetic,
     CompoundArithmetic,
@@ -29,6 +30,7 @@ from .expressions import (
     CaseWhen,
     OrderByItem,
     SelectExpr,
+    SELECT_EXPR_ADAPTER,
 )
 
 from .clauses import (
@@ -67,6 +69,7 @@ __all__ = [
     "NullsOrder",
     # Expressions
     "QualifiedColumn",
+    "qcol",
     "ColumnExpr",
     "BinaryArithmetic",
     "CompoundArithmetic",
@@ -76,6 +79,7 @@ __all__ = [
     "CaseWhen",
     "OrderByItem",
     "SelectExpr",
+    "SELECT_EXPR_ADAPTER",
     # Clauses
     "SimpleCondition",
     "ColumnComparison",
@@ -3,11 +3,12 @@ Clause models for SQL query structure.
 
 Implements WHERE (with two levels), FROM/JOIN, GROUP BY, HAVING, ORDER BY, and LIMIT.
 Uses explicit depth control instead of recursion to maintain compatibility with
-LLM structured outputs.
+LLM structured outputs. All clause models are frozen, so built clauses can be
+shared between queries.
 """
 
-from typing import Literal, Optional, Union
-from pydantic import BaseModel, Field
+from typing import Annotated, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag
 from .enums import (
     Table,
     Column,
@@ -19,6 +20,7 @@ from .enums import (
     NullsOrder,
 )
 from .expressions import QualifiedColumn, AggregateExpr, SelectExpr, OrderByItem
+from .schema_utils import AnyOfUnionSchema
 
 
 # ============================================================================
@@ -34,6 +36,8 @@ class SimpleCondition(BaseModel):
     Examples: price > 100, vendor = 'amazon', category IN ('electronics', 'books')
     """
 
+    model_config = ConfigDict(frozen=True)
+
     cond_type: Literal["simple"] = "simple"
     column: QualifiedColumn = Field(..., description="Column to compare")
     operator: ComparisonOp = Field(..., description="Comparison operator")
@@ -51,6 +55,8 @@ class ColumnComparison(BaseModel):
     Essential for JOIN ON clauses and cross-table comparisons.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     cond_type: Literal["column_comparison"] = "column_comparison"
     left_column: QualifiedColumn = Field(..., description="Left column to compare")
     operator: ComparisonOp = Field(..., description="Comparison operator")
@@ -64,14 +70,40 @@ class BetweenCondition(BaseModel):
     Maps to: column BETWEEN low AND high
     """
 
+    model_config = ConfigDict(frozen=True)
+
     cond_type: Literal["between"] = "between"
     column: QualifiedColumn = Field(..., description="Column to check")
     low: Union[str, int, float] = Field(..., description="Lower bound (inclusive)")
     high: Union[str, int, float] = Field(..., description="Upper bound (inclusive)")
 
 
-# Union type for all condition types
-Condition = Union[SimpleCondition, ColumnComparison, BetweenCondition]
+def _condition_tag(value) -> Optional[str]:
+    """Read cond_type, inferring it from the fields when a dict omits the tag."""
+    if isinstance(value, dict):
+        tag = value.get("cond_type")
+        if tag is not None:
+            return tag
+        # Explicit nulls count as absent, as they do for the optional fields
+        if value.get("left_column") is not None:
+            return "column_comparison"
+        if value.get("low") is not None:
+            return "between"
+        return "simple"
+    return getattr(value, "cond_type", None)
+
+
+# Union type for all condition types, dispatched on cond_type in one lookup
+# instead of trying each model in turn
+Condition = Annotated[
+    Union[
+        Annotated[SimpleCondition, Tag("simple")],
+        Annotated[ColumnComparison, Tag("column_comparison")],
+        Annotated[BetweenCondition, Tag("between")],
+    ],
+    Discriminator(_condition_tag),
+    AnyOfUnionSchema(),
+]
 
 
 class ConditionGroup(BaseModel):
@@ -82,6 +114,8 @@ class ConditionGroup(BaseModel):
     Supports: SimpleCondition, ColumnComparison, and BetweenCondition
     """
 
+    model_config = ConfigDict(frozen=True)
+
     conditions: list[Condition] = Field(
         ..., description="Conditions to combine", min_length=1
     )
@@ -96,6 +130,8 @@ class WhereL0(BaseModel):
     Supports: groups of conditions, BETWEEN, combined with AND/OR.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     groups: list[ConditionGroup] = Field(
         default_factory=list, description="Condition groups"
     )
@@ -120,6 +156,8 @@ class ScalarSubquery(BaseModel):
     Contains WhereL0 internally to prevent recursive nesting.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     table: Table = Field(..., description="Table to query")
     aggregate: AggregateExpr = Field(..., description="Aggregate function to compute")
     where: Optional[WhereL0] = Field(None, description="Filter for subquery")
@@ -133,6 +171,8 @@ class SubqueryCondition(BaseModel):
     Maps to: column OP (SELECT ...)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     column: QualifiedColumn = Field(..., description="Column to compare")
     operator: ComparisonOp = Field(..., description="Comparison operator")
     subquery: ScalarSubquery = Field(..., description="Subquery returning scalar value")
@@ -146,6 +186,8 @@ class WhereL1(BaseModel):
     Subqueries use WhereL0 internally, limiting nesting to exactly 1 level.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     groups: list[ConditionGroup] = Field(
         default_factory=list, description="Simple condition groups"
     )
@@ -173,6 +215,8 @@ class JoinSpec(BaseModel):
     Supports both simple column equality and complex conditions.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     join_type: JoinType = Field(..., description="Type of join")
     table: Table = Field(..., description="Table to join")
     table_alias: Optional[str] = Field(None, description="Alias for joined table")
@@ -197,6 +241,8 @@ class DerivedTable(BaseModel):
     Contains WhereL0 to prevent recursive nesting.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     select: list[SelectExpr] = Field(..., description="Columns to select")
     from_table: Table = Field(..., description="Source table")
     table_alias: Optional[str] = Field(None, description="Alias for source table in derived query")
@@ -216,6 +262,8 @@ class FromClause(BaseModel):
     - With joins: FROM table [alias] JOIN ... JOIN ...
     """
 
+    model_config = ConfigDict(frozen=True)
+
     table: Optional[Table] = Field(None, description="Simple table reference")
     derived: Optional[DerivedTable] = Field(None, description="Derived table (subquery)")
     table_alias: Optional[str] = Field(None, description="Alias for table")
@@ -234,6 +282,8 @@ class GroupByClause(BaseModel):
     Maps to: GROUP BY col1, col2, ...
     """
 
+    model_config = ConfigDict(frozen=True)
+
     columns: list[Column] = Field(..., description="Columns to group by", min_length=1)
 
 
@@ -245,6 +295,8 @@ class HavingCondition(BaseModel):
     Example: AVG(price) > 100
     """
 
+    model_config = ConfigDict(frozen=True)
+
     function: AggregateFunc = Field(..., description="Aggregate function")
     column: Optional[Column] = Field(None, description="Column to aggregate; None for COUNT(*)")
     operator: ComparisonOp = Field(..., description="Comparison operator")
@@ -258,6 +310,8 @@ class HavingClause(BaseModel):
     Maps to: HAVING cond1 LOGIC cond2 LOGIC ...
     """
 
+    model_config = ConfigDict(frozen=True)
+
     conditions: list[HavingCondition] = Field(
         ..., description="Conditions on aggregates", min_length=1
     )
@@ -276,6 +330,8 @@ class OrderByClause(BaseModel):
     Maps to: ORDER BY item1, item2, ...
     """
 
+    model_config = ConfigDict(frozen=True)
+
     items: list[OrderByItem] = Field(
         ..., description="Sort specifications", min_length=1
     )
@@ -288,5 +344,13 @@ class LimitClause(BaseModel):
     Maps to: LIMIT n OFFSET m
     """
 
+    model_config = ConfigDict(frozen=True)
+
     limit: int = Field(..., description="Maximum rows to return", gt=0)
     offset: int = Field(0, description="Number of rows to skip", ge=0)
+
+
+# Resolve DerivedTable's forward references to JoinSpec/GroupByClause now,
+# so the first FROM clause validated does not pay for a lazy rebuild
+DerivedTable.model_rebuild()
+FromClause.model_rebuild()
@@ -148,3 +148,24 @@ class NullsOrder(str, Enum):
 
     first = "FIRST"
     last = "LAST"
+
+
+# SQL text for every member of the SQL-facing enums. A dict probe is much
+# cheaper than the Enum.value descriptor on the translator's hot path; members
+# of different enums that share a value also share the same text.
+ENUM_SQL: dict[Enum, str] = {
+    member: member.value
+    for enum_cls in (
+        Table,
+        Column,
+        ArithmeticOp,
+        ComparisonOp,
+        AggregateFunc,
+        WindowFunc,
+        JoinType,
+        LogicOp,
+        Direction,
+        NullsOrder,
+    )
+    for member in enum_cls
+}
@@ -3,11 +3,13 @@ Expression models for SELECT clause.
 
 Includes column references, computed expressions, aggregates, window functions,
 and CASE expressions. Uses discriminated unions to avoid recursion while maintaining
-type safety for LLM structured outputs.
+type safety for LLM structured outputs. All expression models are frozen, so built
+expressions can be shared between queries.
 """
 
-from typing import Literal, Optional, Union
-from pydantic import BaseModel, Field
+from functools import lru_cache
+from typing import Annotated, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, TypeAdapter
 from .enums import (
     Column,
     ArithmeticOp,
@@ -17,6 +19,7 @@ from .enums import (
     Direction,
     NullsOrder,
 )
+from .schema_utils import AnyOfUnionSchema
 
 
 class QualifiedColumn(BaseModel):
@@ -26,12 +29,26 @@ class QualifiedColumn(BaseModel):
     Used for self-joins and multi-table queries where columns need qualification.
     """
 
+    # Frozen so a single instance can safely be shared between expressions
+    model_config = ConfigDict(frozen=True)
+
     table_alias: Optional[str] = Field(
         None, description="Table alias for qualified references (e.g., 'ours', 'theirs')"
     )
     column: Column = Field(..., description="Column name")
 
 
+@lru_cache(maxsize=4096)
+def qcol(column: Column, table_alias: Optional[str] = None) -> QualifiedColumn:
+    """
+    Shared QualifiedColumn for a (column, table_alias) pair.
+
+    QualifiedColumn is frozen, so repeated references can reuse one validated
+    instance instead of constructing a new one each time.
+    """
+    return QualifiedColumn(column=column, table_alias=table_alias)
+
+
 class ColumnExpr(BaseModel):
     """
     Simple column selection.
@@ -39,6 +56,9 @@ class ColumnExpr(BaseModel):
     Maps to: column_name [AS alias]
     """
 
+    # Frozen so column selections built once (e.g. via qcol) can be reused
+    model_config = ConfigDict(frozen=True)
+
     expr_type: Literal["column"] = "column"
     source: QualifiedColumn = Field(..., description="Column to select")
     alias: Optional[str] = Field(None, description="Optional alias for the column")
@@ -53,6 +73,8 @@ class BinaryArithmetic(BaseModel):
     With table aliases: my.price - comp.price
     """
 
+    model_config = ConfigDict(frozen=True)
+
     expr_type: Literal["binary_arithmetic"] = "binary_arithmetic"
 
     left_column: Optional[Column] = Field(None, description="Left operand as column")
@@ -79,6 +101,8 @@ class CompoundArithmetic(BaseModel):
     Now supports table aliases for multi-table queries.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     expr_type: Literal["compound_arithmetic"] = "compound_arithmetic"
 
     # Inner expression
@@ -109,6 +133,8 @@ class AggregateExpr(BaseModel):
     Supports percentile functions: PERCENTILE_CONT(0.1) for 10th percentile
     """
 
+    model_config = ConfigDict(frozen=True)
+
     expr_type: Literal["aggregate"] = "aggregate"
     function: AggregateFunc = Field(..., description="Aggregate function")
     column: Optional[Column] = Field(
@@ -135,6 +161,9 @@ class OrderByItem(BaseModel):
     Single ORDER BY item used in window functions and ORDER BY clauses.
     """
 
+    # Frozen so common sort keys can be shared between queries
+    model_config = ConfigDict(frozen=True)
+
     column: Column = Field(..., description="Column to sort by")
     direction: Direction = Field(Direction.desc, description="Sort direction")
     nulls: Optional[NullsOrder] = Field(None, description="Null ordering")
@@ -149,6 +178,8 @@ class WindowExpr(BaseModel):
     Supports table aliases: LAG(agg.count) for derived table columns
     """
 
+    model_config = ConfigDict(frozen=True)
+
     expr_type: Literal["window"] = "window"
     function: WindowFunc = Field(..., description="Window function")
     column: Optional[Column] = Field(
@@ -182,6 +213,8 @@ class CaseWhen(BaseModel):
     Simplified to avoid nested conditions - each branch has one simple comparison.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     condition_column: Column = Field(..., description="Column in condition")
     condition_operator: ComparisonOp = Field(..., description="Comparison operator")
     condition_value: Union[str, int, float] = Field(..., description="Value to compare against")
@@ -200,6 +233,8 @@ class CaseExpr(BaseModel):
     Example use: Classify prices into tiers (cheap/medium/expensive)
     """
 
+    model_config = ConfigDict(frozen=True)
+
     expr_type: Literal["case"] = "case"
     whens: list[CaseWhen] = Field(..., description="WHEN branches", max_length=10)
 
@@ -211,15 +246,55 @@ class CaseExpr(BaseModel):
     alias: str = Field(..., description="Required alias for CASE result")
 
 
-# Union type for all possible SELECT expressions
-SelectExpr = Union[
-    ColumnExpr,
-    BinaryArithmetic,
-    CompoundArithmetic,
-    AggregateExpr,
-    WindowExpr,
-    CaseExpr,
+# Window-only functions; anything else with a "function" key and no window
+# fields is read as an aggregate, as smart-mode union matching did
+_WINDOW_ONLY_FUNCS = frozenset({"RANK", "DENSE_RANK", "ROW_NUMBER", "LAG", "LEAD"})
+_WINDOW_KEYS = frozenset({"partition_by", "order_by", "offset", "default_value"})
+
+
+def _select_expr_tag(value) -> Optional[str]:
+    """Read expr_type, inferring it from the fields when a dict omits the tag."""
+    if not isinstance(value, dict):
+        return getattr(value, "expr_type", None)
+    tag = value.get("expr_type")
+    if tag is not None:
+        return tag
+    # Explicit nulls count as absent, as they do for the optional fields
+    if value.get("source") is not None:
+        return "column"
+    if value.get("whens") is not None:
+        return "case"
+    if value.get("inner_operator") is not None:
+        return "compound_arithmetic"
+    function = value.get("function")
+    if function is not None:
+        # Non-string functions fall through to the aggregate's own validation
+        if (isinstance(function, str) and function in _WINDOW_ONLY_FUNCS) or any(
+            value.get(key) is not None for key in _WINDOW_KEYS
+        ):
+            return "window"
+        return "aggregate"
+    return "binary_arithmetic"
+
+
+# Union type for all possible SELECT expressions, dispatched on expr_type in
+# one lookup instead of trying each model in turn
+SelectExpr = Annotated[
+    Union[
+        Annotated[ColumnExpr, Tag("column")],
+        Annotated[BinaryArithmetic, Tag("binary_arithmetic")],
+        Annotated[CompoundArithmetic, Tag("compound_arithmetic")],
+        Annotated[AggregateExpr, Tag("aggregate")],
+        Annotated[WindowExpr, Tag("window")],
+        Annotated[CaseExpr, Tag("case")],
+    ],
+    Discriminator(_select_expr_tag),
+    AnyOfUnionSchema(),
 ]
 
 # Rebuild AggregateExpr to resolve forward reference to BinaryArithmetic
 AggregateExpr.model_rebuild()
+
+# Shared validator for single SELECT items; building a TypeAdapter is costly,
+# so validate ad-hoc items through this one instead of creating new ones
+SELECT_EXPR_ADAPTER: TypeAdapter[SelectExpr] = TypeAdapter(SelectExpr)
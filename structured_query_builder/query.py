@@ -5,7 +5,9 @@ Represents a complete SQL SELECT query with all supported features.
 This is the top-level model that LLMs generate via structured outputs.
 """
 
-from typing import Optional
+import copy
+import weakref
+from typing import Any, Optional
 from pydantic import BaseModel, Field, ConfigDict
 from .expressions import SelectExpr
 from .clauses import (
@@ -68,6 +70,11 @@ class Query(BaseModel):
 
     model_config = ConfigDict(populate_by_name=True)  # Allow both 'from_' and 'from'
 
+    @classmethod
+    def json_schema(cls) -> dict[str, Any]:
+        """JSON schema for structured-output APIs, generated once per class."""
+        return _cached_json_schema(cls)
+
 
 # ============================================================================
 # Simplified Query Models (Tiered Approach)
@@ -89,8 +96,8 @@ class BasicQuery(BaseModel):
         min_length=1,
     )
     where: Optional[WhereL1] = Field(None, description="Filter conditions")
-    group_by: Optional[list[str]] = Field(None, description="Columns to group by")
-    order_by: Optional[list[str]] = Field(None, description="Columns to sort by")
+    group_by: Optional[tuple[str, ...]] = Field(None, description="Columns to group by")
+    order_by: Optional[tuple[str, ...]] = Field(None, description="Columns to sort by")
     limit: Optional[int] = Field(None, description="Maximum rows to return", gt=0)
 
     model_config = ConfigDict(
@@ -98,3 +105,22 @@ class BasicQuery(BaseModel):
             "description": "Simplified query for single-table analytical queries"
         }
     )
+
+    @classmethod
+    def json_schema(cls) -> dict[str, Any]:
+        """JSON schema for structured-output APIs, generated once per class."""
+        return _cached_json_schema(cls)
+
+
+# Schemas keyed weakly by the exact class, so subclasses get their own entry
+_JSON_SCHEMAS: "weakref.WeakKeyDictionary[type[BaseModel], dict[str, Any]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _cached_json_schema(cls: type[BaseModel]) -> dict[str, Any]:
+    """Return a private copy of cls's JSON schema, generating it on first use."""
+    schema = _JSON_SCHEMAS.get(cls)
+    if schema is None:
+        schema = _JSON_SCHEMAS[cls] = cls.model_json_schema()
+    return copy.deepcopy(schema)
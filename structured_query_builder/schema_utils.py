@@ -9,8 +9,8 @@ This module provides robust $ref/$defs dereferencing that handles:
 Usage:
     from structured_query_builder.schema_utils import DereferencedSchemaModel
 
-    # Option 1: Inherit from DereferencedSchemaModel
-    class MyModel(DereferencedSchemaModel):
+    # Option 1: Inherit from DereferencedSchemaModel (before BaseModel)
+    class MyModel(DereferencedSchemaModel, BaseModel):
         field: str
 
     # Option 2: Use dereference_schema() directly
@@ -18,8 +18,12 @@ Usage:
     clean_schema = dereference_schema(schema)
 """
 
-from typing import Any, Dict, List, Set
+from typing import Any, Callable, Dict, List, Optional
+import ast
 import copy
+import functools
+import json
+import weakref
 
 
 def dereference_schema(
@@ -38,11 +42,13 @@ def dereference_schema(
 
     Args:
         schema: JSON schema dict with potential $ref/$defs
-        detect_cycles: If True, raise error on circular references
+        detect_cycles: If True, raise error on circular references; if False,
+            the $ref that closes a cycle is left in place
         remove_defs: If True, remove $defs key after dereferencing
 
     Returns:
-        Dereferenced schema with all $ref replaced by actual definitions
+        Dereferenced schema with all $ref replaced by actual definitions.
+        The result is an independent copy; the input is never modified.
 
     Raises:
         ValueError: If circular reference detected and detect_cycles=True
@@ -56,6 +62,31 @@ def dereference_schema(
         >>> dereferenced["properties"]["bar"]
         {"type": "object"}
     """
+    if not schema.get("$defs", schema.get("definitions")):
+        # No references to resolve
+        return schema
+
+    # The walk shares untouched subtrees with the input and each resolved
+    # definition between its $ref sites; copy once so nothing is aliased
+    return _copy_tree(
+        _dereference_shared(
+            schema, detect_cycles=detect_cycles, remove_defs=remove_defs
+        )
+    )
+
+
+def _dereference_shared(
+    schema: Dict[str, Any],
+    *,
+    detect_cycles: bool,
+    remove_defs: bool,
+) -> Dict[str, Any]:
+    """
+    dereference_schema without the final copy.
+
+    The result shares subtrees with the input and between $ref sites, so it
+    must be copied before it is handed to callers.
+    """
     # Extract definitions (Pydantic v2 uses $defs, v1 uses definitions)
     definitions = schema.get("$defs", schema.get("definitions", {}))
 
@@ -63,108 +94,292 @@ def dereference_schema(
         # No references to resolve
         return schema
 
-    # Track visited refs if cycle detection enabled
-    visited: Set[str] = set() if detect_cycles else set()
+    # Definitions currently being resolved, in descent order (DFS "gray"
+    # set); fully resolved ones move to the memo below ("black")
+    resolving: Dict[str, None] = {}
 
-    # Deep copy to avoid modifying original
-    result = copy.deepcopy(schema)
+    # Drop definitions up front (shallow copy) so they are not walked for nothing
+    if remove_defs:
+        schema = {
+            key: value
+            for key, value in schema.items()
+            if key != "$defs" and key != "definitions"
+        }
 
-    # Recursively dereference
-    result = _dereference_recursive(result, definitions, visited, detect_cycles)
+    # A schema whose definitions are all inlined has nothing to resolve
+    if not _may_contain_refs(schema):
+        return schema
+
+    # Each definition is dereferenced once, then shared by every $ref to it
+    resolved: Dict[str, Any] = {}
+
+    # Walk the schema, copying only nodes on a path to a $ref
+    return _dereference_walk(
+        schema, definitions, resolved, resolving, detect_cycles
+    )
+
+
+def _may_contain_refs(schema: Dict[str, Any]) -> bool:
+    """
+    Cheap C-level precheck for any "$ref" key in the schema.
+
+    False positives (e.g. "$ref" inside a description) only cost the walk;
+    schemas json cannot encode or nest too deeply are assumed to have refs.
+    """
+    try:
+        return '"$ref"' in json.dumps(schema, default=str)
+    except (TypeError, ValueError, RecursionError):
+        return True
 
-    # Remove definitions after dereferencing
-    if remove_defs:
-        result.pop("$defs", None)
-        result.pop("definitions", None)
 
-    return result
+# Local $ref prefixes: Pydantic v2 ("#/$defs/Name") and v1 ("#/definitions/Name")
+_DEFS_PREFIX = "#/$defs/"
+_DEFS_PREFIX_LEN = len(_DEFS_PREFIX)
+_DEFINITIONS_PREFIX = "#/definitions/"
+_DEFINITIONS_PREFIX_LEN = len(_DEFINITIONS_PREFIX)
+
+# Marks a visited container whose result is not known until its children are
+_PENDING = object()
+
+# Leaf types json.loads and Pydantic produce. Nodes are dispatched on their
+# exact type, which is cheaper than isinstance chains on every visit; anything
+# else (e.g. a dict subclass) goes through isinstance.
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def _node_kind(obj: Any) -> Optional[type]:
+    """
+    Type to dispatch obj on: dict, list, or a scalar's own type.
+
+    Dict and list subclasses map to their base type; any other value maps
+    to None.
+    """
+    obj_type = type(obj)
+    if obj_type is dict or obj_type is list or obj_type in _SCALAR_TYPES:
+        return obj_type
+    return dict if isinstance(obj, dict) else list if isinstance(obj, list) else None
 
 
-def _dereference_recursive(
-    obj: Any,
+def _dereference_walk(
+    root: Any,
     definitions: Dict[str, Any],
-    visited: Set[str],
+    resolved: Dict[str, Any],
+    resolving: Dict[str, None],
     detect_cycles: bool,
-    current_path: str = "root"
 ) -> Any:
     """
-    Recursive helper for dereference_schema.
+    Iterative helper for dereference_schema.
 
     Handles dicts, lists, and primitive values.
     Unlike LangChain's implementation, this DOES handle lists.
+
+    Uses an explicit stack instead of recursion, so schema depth is not
+    bounded by the interpreter's recursion limit. Unchanged nodes are kept as
+    the original object; only containers with a $ref somewhere below them are
+    copied. Dereferenced definitions are memoized in ``resolved`` by name; a
+    $ref to a name still in ``resolving`` closes a cycle.
     """
-    if isinstance(obj, dict):
-        # Check if this is a $ref
-        if "$ref" in obj:
-            ref_path = obj["$ref"]
-
-            # Extract definition name from ref path
-            # Handles both "#/$defs/Name" and "#/definitions/Name"
-            if ref_path.startswith("#/$defs/"):
-                def_name = ref_path[len("#/$defs/"):]
-            elif ref_path.startswith("#/definitions/"):
-                def_name = ref_path[len("#/definitions/"):]
+    # Frames are [container, children, copy or None, key in parent, path] or,
+    # while a definition is being walked, [None, def_name, None, key, path]
+    stack: List[list] = []
+    node, key, path = root, None, "root"
+
+    while True:
+        # Visit node: either its (value, changed) result is known right away,
+        # or a frame is pushed and its children are walked first
+        value, changed = _PENDING, False
+        node_type = _node_kind(node)
+        if node_type is dict:
+            if "$ref" in node:
+                ref_path = node["$ref"]
+
+                # Extract definition name from ref path
+                # Handles both "#/$defs/Name" and "#/definitions/Name"
+                if ref_path.startswith(_DEFS_PREFIX):
+                    def_name = ref_path[_DEFS_PREFIX_LEN:]
+                elif ref_path.startswith(_DEFINITIONS_PREFIX):
+                    def_name = ref_path[_DEFINITIONS_PREFIX_LEN:]
+                else:
+                    # External reference or unsupported format
+                    # Return as-is (could add external file support here)
+                    def_name = None
+
+                if def_name is None:
+                    value = node
+                elif def_name in resolved:
+                    value, changed = resolved[def_name], True
+                elif def_name in resolving:
+                    # Cycle: expanding it would never terminate, so either
+                    # fail or keep this $ref as-is
+                    if detect_cycles:
+                        raise ValueError(
+                            f"Circular reference detected: {def_name} at {path}\n"
+                            f"Reference chain: {' -> '.join(resolving)} -> {def_name}"
+                        )
+                    value = node
+                else:
+                    resolving[def_name] = None
+
+                    # Get the referenced definition
+                    if def_name not in definitions:
+                        raise ValueError(f"Reference not found: {ref_path} at {path}")
+
+                    # Walk the definition; its result is memoized on the way up
+                    path = f"{path}.$ref[{def_name}]"
+                    stack.append([None, def_name, None, key, path])
+                    node = definitions[def_name]
+                    continue
             else:
-                # External reference or unsupported format
-                # Return as-is (could add external file support here)
-                return obj
-
-            # Cycle detection
-            if detect_cycles:
-                if def_name in visited:
-                    raise ValueError(
-                        f"Circular reference detected: {def_name} at {current_path}\n"
-                        f"Reference chain: {' -> '.join(visited)} -> {def_name}"
-                    )
-                visited.add(def_name)
-
-            # Get the referenced definition
-            if def_name not in definitions:
-                raise ValueError(f"Reference not found: {ref_path} at {current_path}")
-
-            # Recursively dereference the definition
-            resolved = _dereference_recursive(
-                definitions[def_name],
-                definitions,
-                visited.copy() if detect_cycles else visited,  # Copy for branch
-                detect_cycles,
-                f"{current_path}.$ref[{def_name}]"
-            )
+                stack.append([node, iter(node.items()), None, key, path])
+        elif node_type is list:
+            # CRITICAL: Handle lists (LangChain's bug is here)
+            # This handles anyOf/oneOf/allOf with $ref inside arrays
+            stack.append([node, enumerate(node), None, key, path])
+        else:
+            # Primitive value, return as-is
+            value = node
+
+        # Hand finished results up the stack until a frame has a child left
+        while True:
+            if value is not _PENDING:
+                if not stack:
+                    return value
+                frame = stack[-1]
+                if frame[0] is None:
+                    # Definition finished: memoize, then hand it to the $ref's parent
+                    stack.pop()
+                    def_name = frame[1]
+                    resolved[def_name] = value
+                    del resolving[def_name]
+                    changed, key = True, frame[3]
+                    continue
+                if changed:
+                    # Copy on first change
+                    if frame[2] is None:
+                        frame[2] = frame[0].copy()
+                    frame[2][key] = value
+
+            frame = stack[-1]
+            container, children, copied, _, parent_path = frame
+            for key, node in children:
+                if isinstance(container, dict):
+                    path = f"{parent_path}.{key}"
+                else:
+                    path = f"{parent_path}[{key}]"
+                break
+            else:
+                # All children done
+                stack.pop()
+                key = frame[3]
+                if copied is None:
+                    value, changed = container, False
+                else:
+                    value, changed = copied, True
+                continue
+            break
+
+
+def _literal_node(obj: Any) -> ast.expr:
+    """AST for a Python literal that rebuilds a JSON-compatible value."""
+    obj_type = type(obj)
+    if obj_type is dict:
+        return ast.Dict(
+            keys=[_literal_node(key) for key in obj],
+            values=[_literal_node(value) for value in obj.values()],
+        )
+    if obj_type is list:
+        return ast.List(elts=[_literal_node(item) for item in obj], ctx=ast.Load())
+    if obj_type in _SCALAR_TYPES:
+        return ast.Constant(obj)
+    raise TypeError(f"Not a JSON literal: {obj_type.__name__}")
 
-            if detect_cycles:
-                visited.discard(def_name)
 
-            return resolved
+def _copy_tree(obj: Any) -> Any:
+    """
+    Deep copy of nested dicts and lists using an explicit stack.
 
-        # Not a $ref, recursively process all keys
-        return {
-            key: _dereference_recursive(
-                value,
-                definitions,
-                visited,
-                detect_cycles,
-                f"{current_path}.{key}"
-            )
-            for key, value in obj.items()
-        }
+    Unlike copy.deepcopy, depth is not bounded by the recursion limit. Other
+    non-scalar leaves are copied with copy.deepcopy.
+    """
+    holder = [None]
+    stack = [(holder, 0, obj)]
+    while stack:
+        parent, key, node = stack.pop()
+        node_type = _node_kind(node)
+        if node_type is dict:
+            # Same type and key order; values are replaced as the stack unwinds
+            parent[key] = new = copy.copy(node)
+            for child_key, child in node.items():
+                stack.append((new, child_key, child))
+        elif node_type is list:
+            parent[key] = new = copy.copy(node)
+            for index, child in enumerate(node):
+                stack.append((new, index, child))
+        elif node_type is not None:
+            parent[key] = node
+        else:
+            parent[key] = copy.deepcopy(node)
+    return holder[0]
+
+
+def _compile_schema_copier(schema: Dict[str, Any]) -> Callable[[], Dict[str, Any]]:
+    """
+    Compile a schema into a function that returns a fresh copy of it.
 
-    elif isinstance(obj, list):
-        # CRITICAL: Handle lists (LangChain's bug is here)
-        # This handles anyOf/oneOf/allOf with $ref inside arrays
-        return [
-            _dereference_recursive(
-                item,
-                definitions,
-                visited,
-                detect_cycles,
-                f"{current_path}[{i}]"
-            )
-            for i, item in enumerate(obj)
-        ]
+    The function body is a single dict literal, which evaluates several times
+    faster than copy.deepcopy. Schemas with non-JSON values, or nested too
+    deeply for the compiler, fall back to the iterative _copy_tree.
+    """
+    no_args = ast.arguments(
+        posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[]
+    )
+    try:
+        expr = ast.Expression(body=ast.Lambda(args=no_args, body=_literal_node(schema)))
+        code = compile(ast.fix_missing_locations(expr), "<dereferenced schema>", "eval")
+    except (TypeError, RecursionError):
+        return functools.partial(_copy_tree, schema)
+    return eval(code, {"__builtins__": {}})
+
+
+# Compiled copiers of dereferenced schemas: model class -> (by_alias, mode)
+# -> copier. Only calls with the default ref_template and schema_generator are
+# cached. Classes are held weakly, so models built per request are not pinned.
+_DEREF_CACHE: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def _cached_dereferenced_schema(
+    cls,
+    generate,
+    by_alias: bool,
+    ref_template: str,
+    schema_generator: type,
+    mode: str,
+) -> Dict[str, Any]:
+    """
+    Dereference generate(**kwargs), reusing the result for repeated calls.
 
-    else:
-        # Primitive value, return as-is
-        return obj
+    Arguments left as ... fall back to Pydantic's defaults. Every call returns
+    a fresh copy, so callers may mutate the schema freely.
+    """
+    kwargs: Dict[str, Any] = {"by_alias": by_alias, "mode": mode}
+    if ref_template is not ...:
+        kwargs["ref_template"] = ref_template
+    if schema_generator is not ...:
+        kwargs["schema_generator"] = schema_generator
+    if len(kwargs) > 2:
+        return dereference_schema(generate(**kwargs), detect_cycles=True)
+
+    copiers = _DEREF_CACHE.setdefault(cls, {})
+    key = (by_alias, mode)
+    copier = copiers.get(key)
+    if copier is None:
+        # The copier rebuilds the whole tree, so the shared walk result is safe
+        copier = copiers[key] = _compile_schema_copier(
+            _dereference_shared(
+                generate(**kwargs), detect_cycles=True, remove_defs=True
+            )
+        )
+    return copier()
 
 
 def get_dereferenced_schema(model_class) -> Dict[str, Any]:
@@ -195,7 +410,7 @@ class DereferencedSchemaModel:
     Mixin for Pydantic models that provides dereferenced schema generation.
 
     Usage:
-        class MyModel(BaseModel, DereferencedSchemaModel):
+        class MyModel(DereferencedSchemaModel, BaseModel):
             field: str
 
         # This will use dereferenced schema
@@ -204,6 +419,8 @@ class DereferencedSchemaModel:
     How it works:
         Overrides model_json_schema() to return dereferenced schema.
         LangChain calls this method, gets clean schema, skips buggy preprocessing.
+        The mixin must precede BaseModel in the bases to take effect. Results
+        are cached per (class, by_alias, mode).
     """
 
     @classmethod
@@ -222,20 +439,16 @@ class DereferencedSchemaModel:
         WITHOUT $defs, preventing LangChain's replace_defs_in_schema
         from running (or at least making it a no-op).
         """
-        # Import here to avoid circular dependency
-        from pydantic import BaseModel
-
-        # Get original schema with $defs
-        schema = super(BaseModel, cls).model_json_schema(
-            by_alias=by_alias,
-            ref_template=ref_template if ref_template is not ... else ...,
-            schema_generator=schema_generator if schema_generator is not ... else ...,
-            mode=mode,
+        # Original schema with $defs comes from the next class in the MRO
+        return _cached_dereferenced_schema(
+            cls,
+            super().model_json_schema,
+            by_alias,
+            ref_template,
+            schema_generator,
+            mode,
         )
 
-        # Dereference it
-        return dereference_schema(schema, detect_cycles=True)
-
 
 # Alternative: Decorator approach
 def dereferenced_schema(cls):
@@ -248,9 +461,9 @@ def dereferenced_schema(cls):
             field: str
 
     This modifies the model_json_schema classmethod to return
-    dereferenced schemas.
+    dereferenced schemas, cached per (class, by_alias, mode).
     """
-    original_method = cls.model_json_schema
+    original_method = cls.model_json_schema.__func__
 
     @classmethod
     def dereferenced_model_json_schema(
@@ -261,18 +474,41 @@ def dereferenced_schema(cls):
         schema_generator: type = ...,
         mode: str = "validation",
     ) -> Dict[str, Any]:
-        schema = original_method(
-            by_alias=by_alias,
-            ref_template=ref_template if ref_template is not ... else ...,
-            schema_generator=schema_generator if schema_generator is not ... else ...,
-            mode=mode,
+        return _cached_dereferenced_schema(
+            cls_inner,
+            functools.partial(original_method, cls_inner),
+            by_alias,
+            ref_template,
+            schema_generator,
+            mode,
         )
-        return dereference_schema(schema, detect_cycles=True)
 
     cls.model_json_schema = dereferenced_model_json_schema
     return cls
 
 
+class AnyOfUnionSchema:
+    """
+    Annotation that renders a discriminated union as a plain anyOf.
+
+    Pydantic emits oneOf plus a discriminator mapping for tagged unions, which
+    Vertex AI rejects. Validation keeps the O(1) tag dispatch; only the JSON
+    schema is rewritten.
+
+    Usage:
+        Expr = Annotated[
+            Union[A, B], Field(discriminator="kind"), AnyOfUnionSchema()
+        ]
+    """
+
+    def __get_pydantic_json_schema__(self, core_schema, handler) -> Dict[str, Any]:
+        schema = handler(core_schema)
+        if "oneOf" in schema:
+            schema["anyOf"] = schema.pop("oneOf")
+            schema.pop("discriminator", None)
+        return schema
+
+
 # For debugging: Analyze schema complexity
 def analyze_schema_refs(schema: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -286,31 +522,42 @@ def analyze_schema_refs(schema: Dict[str, Any]) -> Dict[str, Any]:
     ref_count = 0
     refs_in_lists = 0
     max_depth = 0
-
-    def count_refs(obj, depth=0):
-        nonlocal ref_count, refs_in_lists, max_depth
-        max_depth = max(max_depth, depth)
-
-        if isinstance(obj, dict):
+    has_any_of = False
+    has_one_of = False
+
+    # Iterative walk over (node, depth) pairs: no recursion limit, and the
+    # counters stay plain locals instead of closure cells
+    stack = [(schema, 0)]
+    while stack:
+        obj, depth = stack.pop()
+        if depth > max_depth:
+            max_depth = depth
+
+        obj_type = _node_kind(obj)
+        if obj_type is dict:
             if "$ref" in obj:
                 ref_count += 1
+            if "anyOf" in obj:
+                has_any_of = True
+            if "oneOf" in obj:
+                has_one_of = True
+            depth += 1
             for value in obj.values():
-                count_refs(value, depth + 1)
-        elif isinstance(obj, list):
+                stack.append((value, depth))
+        elif obj_type is list:
+            depth += 1
             for item in obj:
                 if isinstance(item, dict) and "$ref" in item:
                     refs_in_lists += 1
-                count_refs(item, depth + 1)
-
-    count_refs(schema)
+                stack.append((item, depth))
 
     return {
         "num_definitions": len(defs),
         "total_refs": ref_count,
         "refs_in_lists": refs_in_lists,
         "max_depth": max_depth,
-        "has_anyOf": "anyOf" in str(schema),
-        "has_oneOf": "oneOf" in str(schema),
+        "has_anyOf": has_any_of,
+        "has_oneOf": has_one_of,
         "langchain_bug_risk": refs_in_lists > 0,  # Issue #1023
     }
 
@@ -543,7 +543,7 @@ class TestSchemaMetrics:
 
     def test_measure_schema_size(self):
         """Measure JSON schema size."""
-        schema = Query.model_json_schema()
+        schema = Query.json_schema()
         import json
         schema_json = json.dumps(schema)
         size_bytes = len(schema_json.encode('utf-8'))
@@ -561,7 +561,7 @@ class TestSchemaMetrics:
 
     def test_measure_schema_depth(self):
         """Measure actual nesting depth."""
-        schema = Query.model_json_schema()
+        schema = Query.json_schema()
 
         def measure_depth(obj, current_depth=0):
             if not isinstance(obj, dict):
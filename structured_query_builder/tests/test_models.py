@@ -39,6 +39,17 @@ class TestExpressions:
         assert expr.source.column == Column.vendor
         assert expr.alias == "vendor_name"
 
+    def test_column_expr_is_frozen(self):
+        expr = ColumnExpr(source=QualifiedColumn(column=Column.vendor))
+        with pytest.raises(ValidationError):
+            expr.alias = "renamed"
+        assert hash(expr) == hash(ColumnExpr(source=QualifiedColumn(column=Column.vendor)))
+
+    def test_order_by_item_is_frozen(self):
+        item = OrderByItem(column=Column.regular_price, direction=Direction.desc)
+        with pytest.raises(ValidationError):
+            item.direction = Direction.asc
+
     def test_qualified_column_with_alias(self):
         col = QualifiedColumn(
             table_alias="ours",
@@ -47,6 +58,12 @@ class TestExpressions:
         assert col.table_alias == "ours"
         assert col.column == Column.regular_price
 
+    def test_qcol_returns_shared_instance(self):
+        col = qcol(Column.regular_price, "my")
+        assert col is qcol(Column.regular_price, "my")
+        assert col == QualifiedColumn(column=Column.regular_price, table_alias="my")
+        assert qcol(Column.regular_price) is not col
+
     def test_binary_arithmetic(self):
         expr = BinaryArithmetic(
             left_column=Column.regular_price,
@@ -143,6 +160,38 @@ class TestExpressions:
         assert len(expr.whens) == 2
         assert expr.else_value == "expensive"
 
+    def test_select_expr_dispatch_from_dicts(self):
+        cases = [
+            ({"expr_type": "window", "function": "SUM", "alias": "s"}, WindowExpr),
+            # expr_type omitted: inferred from the fields present
+            ({"source": {"column": "vendor"}}, ColumnExpr),
+            ({"function": "AVG", "column": "regular_price", "alias": "a"}, AggregateExpr),
+            ({"function": "RANK", "alias": "r"}, WindowExpr),
+            ({"function": "SUM", "partition_by": ["vendor"], "alias": "s"}, WindowExpr),
+            ({"left_column": "regular_price", "operator": "-", "right_value": 1, "alias": "d"},
+             BinaryArithmetic),
+        ]
+        for data, expected in cases:
+            assert type(SELECT_EXPR_ADAPTER.validate_python(data)) is expected
+
+        with pytest.raises(ValidationError):
+            SELECT_EXPR_ADAPTER.validate_python({"expr_type": "bogus", "alias": "x"})
+
+    def test_select_expr_inference_treats_null_as_absent(self):
+        """Explicit nulls for window-only keys still validate as an aggregate."""
+        data = {
+            "function": "SUM", "column": "regular_price", "alias": "s",
+            "partition_by": None, "order_by": None,
+        }
+        assert type(SELECT_EXPR_ADAPTER.validate_python(data)) is AggregateExpr
+
+    def test_select_expr_unhashable_function_is_validation_error(self):
+        """Malformed LLM output surfaces as ValidationError, not TypeError."""
+        with pytest.raises(ValidationError):
+            SELECT_EXPR_ADAPTER.validate_python(
+                {"function": ["SUM"], "column": "regular_price", "alias": "s"}
+            )
+
 
 class TestConditions:
     """Test WHERE clause condition models."""
@@ -194,6 +243,43 @@ class TestConditions:
         assert len(group.conditions) == 2
         assert group.logic == LogicOp.and_
 
+    def test_condition_dispatch_from_dicts(self):
+        group = ConditionGroup.model_validate({
+            "logic": "AND",
+            "conditions": [
+                {"cond_type": "between", "column": {"column": "regular_price"}, "low": 1, "high": 9},
+                # cond_type omitted: inferred from the fields present
+                {"column": {"column": "vendor"}, "operator": "=", "value": "Us"},
+                {"left_column": {"column": "id"}, "operator": "=", "right_column": {"column": "id"}},
+            ],
+        })
+        assert [type(c) for c in group.conditions] == [
+            BetweenCondition, SimpleCondition, ColumnComparison
+        ]
+
+        with pytest.raises(ValidationError):
+            ConditionGroup.model_validate(
+                {"logic": "AND", "conditions": [{"cond_type": "bogus"}]}
+            )
+
+    def test_condition_inference_treats_null_as_absent(self):
+        """Explicit null left_column/low still validate as a simple condition."""
+        group = ConditionGroup.model_validate({
+            "logic": "AND",
+            "conditions": [{
+                "column": {"column": "vendor"}, "operator": "=", "value": "Us",
+                "left_column": None, "low": None,
+            }],
+        })
+        assert type(group.conditions[0]) is SimpleCondition
+
+    def test_condition_schema_stays_any_of(self):
+        """Tagged union must not emit oneOf, which Vertex AI rejects."""
+        items = ConditionGroup.model_json_schema()["properties"]["conditions"]["items"]
+        assert "anyOf" in items
+        assert "oneOf" not in items
+        assert "discriminator" not in items
+
     def test_where_l0(self):
         where = WhereL0(
             groups=[
@@ -363,6 +449,11 @@ class TestFromJoin:
         assert len(derived.select) == 2
         assert derived.alias == "ranked"
 
+    def test_from_models_built_at_import(self):
+        """Forward references are resolved eagerly, not on first validation."""
+        assert DerivedTable.__pydantic_complete__
+        assert FromClause.__pydantic_complete__
+
 
 class TestAggregation:
     """Test GROUP BY and HAVING models."""
@@ -479,3 +570,29 @@ class TestCompleteQuery:
         # Should deserialize back
         reconstructed = Query.model_validate_json(json_str)
         assert reconstructed.select[0].source.column == Column.vendor
+
+    def test_basic_query_keys_are_tuples(self):
+        """BasicQuery accepts list input and stores group/order keys as tuples."""
+        query = BasicQuery(
+            table="product_offers",
+            select=[ColumnExpr(source=qcol(Column.category))],
+            group_by=["category"],
+            order_by=["category"],
+        )
+        assert query.group_by == ("category",)
+        assert query.order_by == ("category",)
+
+    def test_json_schema_is_cached_per_class(self):
+        """json_schema() matches model_json_schema() and hands out private copies."""
+        assert Query.json_schema() == Query.model_json_schema()
+        assert BasicQuery.json_schema() == BasicQuery.model_json_schema()
+
+        schema = Query.json_schema()
+        schema["properties"].clear()
+        assert Query.json_schema() == Query.model_json_schema()
+
+        class TitledQuery(Query):
+            pass
+
+        assert TitledQuery.json_schema()["title"] == "TitledQuery"
+        assert Query.json_schema()["title"] == "Query"
@@ -146,6 +146,29 @@ class TestPhase3Queries:
         # Verify limit for top velocity products
         assert "LIMIT 200" in sql
 
+    def test_phase3_builders_are_memoized(self):
+        """Repeated calls return equal but independent Query copies."""
+        from examples import phase3_queries
+
+        for query_func in (
+            phase3_queries.query_27_vendor_fairness_audit,
+            phase3_queries.query_28_safe_haven_scanner,
+            phase3_queries.query_29_inventory_velocity_detector,
+        ):
+            first, second = query_func(), query_func()
+            assert first == second
+            assert first is not second
+            first.select.append(first.select[0])
+            assert query_func() == second
+
+    def test_phase3_sql_snapshots_are_current(self):
+        """Checked-in SQL snapshots match a fresh translation."""
+        from examples import phase3_queries
+
+        for _, query_func in phase3_queries._QUERIES:
+            assert phase3_queries.load_sql(query_func) == translate_query(query_func()), \
+                f"Stale snapshot for {query_func.__name__}; run phase3_queries.py --regenerate"
+
 
 class TestPhase2Phase3Serialization:
     """Test that all Phase 2 and Phase 3 queries serialize correctly."""
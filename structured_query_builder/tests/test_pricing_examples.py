@@ -0,0 +1,34 @@
+"""
+Tests for the pricing analyst example module.
+
+Tests coverage:
+- Checked-in SQL snapshots stay in sync with the query builders
+- Example functions return the cached Query instances
+"""
+
+import pytest
+from structured_query_builder.translator import translate_query
+
+
+class TestPricingAnalystExamples:
+    """Test pricing analyst examples and their SQL snapshots."""
+
+    def test_sql_snapshots_are_current(self):
+        """Checked-in SQL snapshots match a fresh translation."""
+        from examples import pricing_analyst_queries
+
+        for name, build in pricing_analyst_queries._BUILDERS.items():
+            assert pricing_analyst_queries.load_sql(name) == translate_query(build()), \
+                f"Stale snapshot for {name}; run pricing_analyst_queries.py --regenerate"
+
+    def test_examples_are_compiled_once(self):
+        """Lazy module attributes serve the same cached Query and SQL."""
+        from examples import pricing_analyst_queries
+
+        query, sql = pricing_analyst_queries.discount
+        assert pricing_analyst_queries.discount[0] is query
+        assert "WHERE is_markdown = TRUE" in sql
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,267 @@
+"""
+Tests for JSON schema dereferencing utilities.
+
+Tests coverage:
+- $ref resolution inside dicts and anyOf lists
+- Circular reference detection
+- Cached schemas on DereferencedSchemaModel and @dereferenced_schema
+- Fresh, independent copies served from the schema cache
+"""
+
+import gc
+import sys
+import weakref
+from collections import OrderedDict
+
+import pytest
+from pydantic import BaseModel, ConfigDict
+from structured_query_builder.schema_utils import (
+    DereferencedSchemaModel,
+    analyze_schema_refs,
+    dereference_schema,
+    dereferenced_schema,
+    get_dereferenced_schema,
+)
+
+
+class Inner(BaseModel):
+    value: int
+
+
+class Outer(DereferencedSchemaModel, BaseModel):
+    inner: Inner
+    items: list[Inner | str]
+
+
+class RefList(list):
+    pass
+
+
+@dereferenced_schema
+class Decorated(BaseModel):
+    inner: Inner
+
+
+class TestDereferenceSchema:
+    """Test dereference_schema on hand-written schemas."""
+
+    def test_resolves_refs_in_lists(self):
+        """$ref inside anyOf arrays is replaced and $defs is dropped."""
+        schema = {
+            "$defs": {"Foo": {"type": "object"}},
+            "properties": {
+                "bar": {"$ref": "#/$defs/Foo"},
+                "baz": {"anyOf": [{"$ref": "#/$defs/Foo"}, {"type": "null"}]},
+            },
+        }
+        result = dereference_schema(schema)
+        assert result["properties"]["bar"] == {"type": "object"}
+        assert result["properties"]["baz"]["anyOf"][0] == {"type": "object"}
+        assert "$defs" not in result
+        assert "$defs" in schema
+
+    def test_result_does_not_alias_input(self):
+        """Subtrees without a $ref are copied, not shared with the input."""
+        plain = {"type": "string", "enum": ["a", "b"]}
+        schema = {
+            "$defs": {"Foo": {"type": "object"}},
+            "properties": {"bar": {"$ref": "#/$defs/Foo"}, "baz": plain},
+        }
+        result = dereference_schema(schema)
+        result["properties"]["baz"]["enum"].append("c")
+        result["properties"]["bar"]["type"] = "string"
+        assert plain == {"type": "string", "enum": ["a", "b"]}
+        assert schema["$defs"]["Foo"] == {"type": "object"}
+        assert schema["properties"]["bar"] == {"$ref": "#/$defs/Foo"}
+
+    def test_ref_sites_are_independent(self):
+        """Each $ref to a definition gets its own copy of the subtree."""
+        schema = {
+            "$defs": {
+                "Foo": {"properties": {"bar": {"$ref": "#/$defs/Bar"}}},
+                "Bar": {"type": "integer"},
+            },
+            "properties": {
+                "a": {"$ref": "#/$defs/Foo"},
+                "b": {"items": {"$ref": "#/$defs/Foo"}},
+            },
+        }
+        result = dereference_schema(schema)
+        first, second = result["properties"]["a"], result["properties"]["b"]["items"]
+        assert first == second
+        assert first["properties"]["bar"] == {"type": "integer"}
+        first["properties"]["bar"]["type"] = "string"
+        assert second["properties"]["bar"] == {"type": "integer"}
+
+    def test_deep_nesting_beyond_recursion_limit(self):
+        """Nesting depth is not bounded by the interpreter recursion limit."""
+        node = {"$ref": "#/$defs/Foo"}
+        for _ in range(sys.getrecursionlimit() + 100):
+            node = {"items": [node]}
+        schema = {"$defs": {"Foo": {"type": "integer"}}, "properties": {"x": node}}
+
+        node = dereference_schema(schema)["properties"]["x"]
+        while "items" in node:
+            node = node["items"][0]
+        assert node == {"type": "integer"}
+
+    def test_schema_without_refs_drops_unused_defs(self):
+        """Unused $defs are dropped and the body is still copied."""
+        properties = {"bar": {"type": "string"}}
+        schema = {"$defs": {"Foo": {"type": "object"}}, "properties": properties}
+        result = dereference_schema(schema)
+        assert result == {"properties": properties}
+        assert result["properties"] is not properties
+        kept = dereference_schema(schema, remove_defs=False)
+        assert kept == schema
+        assert kept is not schema
+
+    def test_container_subclasses_are_walked(self):
+        """Dict and list subclasses dispatch like their base types."""
+        schema = OrderedDict(
+            [
+                ("$defs", {"Foo": {"type": "object"}}),
+                ("properties", OrderedDict([("bar", RefList([{"$ref": "#/$defs/Foo"}]))])),
+            ]
+        )
+        assert dereference_schema(schema)["properties"]["bar"][0] == {"type": "object"}
+
+    def test_circular_reference_raises(self):
+        """Self-referencing definitions are rejected."""
+        schema = {
+            "$defs": {"Node": {"properties": {"next": {"$ref": "#/$defs/Node"}}}},
+            "properties": {"head": {"$ref": "#/$defs/Node"}},
+        }
+        with pytest.raises(ValueError, match="Circular reference"):
+            dereference_schema(schema)
+
+    def test_cycle_kept_as_ref_without_detection(self):
+        """With detect_cycles=False the closing $ref is left unexpanded."""
+        schema = {
+            "$defs": {"Node": {"properties": {"next": {"$ref": "#/$defs/Node"}}}},
+            "properties": {"head": {"$ref": "#/$defs/Node"}},
+        }
+        result = dereference_schema(schema, detect_cycles=False)
+        assert result["properties"]["head"] == {
+            "properties": {"next": {"$ref": "#/$defs/Node"}}
+        }
+
+    def test_cycle_error_reports_reference_chain(self):
+        """The error lists the definitions on the cycle in descent order."""
+        schema = {
+            "$defs": {
+                "A": {"properties": {"b": {"$ref": "#/$defs/B"}}},
+                "B": {"items": [{"$ref": "#/$defs/A"}]},
+            },
+            "properties": {"root": {"$ref": "#/$defs/A"}},
+        }
+        with pytest.raises(ValueError, match="Reference chain: A -> B -> A"):
+            dereference_schema(schema)
+
+
+class TestAnalyzeSchemaRefs:
+    """Test analyze_schema_refs statistics."""
+
+    def test_counts_refs(self):
+        """Refs inside lists are a subset of all refs, not counted twice."""
+        schema = {
+            "$defs": {"Foo": {"type": "object"}},
+            "properties": {
+                "bar": {"$ref": "#/$defs/Foo"},
+                "baz": {"anyOf": [{"$ref": "#/$defs/Foo"}, {"type": "null"}]},
+            },
+        }
+        stats = analyze_schema_refs(schema)
+        assert stats["num_definitions"] == 1
+        assert stats["total_refs"] == 2
+        assert stats["refs_in_lists"] == 1
+        assert stats["max_depth"] == 5
+        assert stats["langchain_bug_risk"]
+        assert stats["has_anyOf"]
+        assert not stats["has_oneOf"]
+
+    def test_union_keywords_detected_as_keys_only(self):
+        """Mentions of oneOf in text do not count as a oneOf union."""
+        schema = {"properties": {"x": {"description": "not a oneOf", "type": "string"}}}
+        stats = analyze_schema_refs(schema)
+        assert not stats["has_oneOf"]
+        assert not stats["has_anyOf"]
+
+
+class TestDereferencedModels:
+    """Test the mixin and decorator entry points."""
+
+    def test_mixin_returns_dereferenced_schema(self):
+        schema = Outer.model_json_schema()
+        assert "$defs" not in schema
+        assert schema["properties"]["inner"]["properties"]["value"]["type"] == "integer"
+
+    def test_decorator_returns_dereferenced_schema(self):
+        schema = Decorated.model_json_schema()
+        assert "$defs" not in schema
+        assert schema["properties"]["inner"]["title"] == "Inner"
+
+    def test_cached_schema_is_not_shared(self):
+        """Mutating a returned schema does not leak into later calls."""
+        first = Outer.model_json_schema()
+        first["properties"].clear()
+        assert Outer.model_json_schema()["properties"]
+
+
+class TestCompiledSchemaCopier:
+    """Test the copies served from the dereferenced-schema cache."""
+
+    def test_returns_fresh_copies(self):
+        """Repeated calls return equal schemas that share no containers."""
+        first, second = get_dereferenced_schema(Outer), get_dereferenced_schema(Outer)
+        assert first == second
+        assert first["properties"]["inner"] is not second["properties"]["inner"]
+        assert (
+            first["properties"]["items"]["items"]["anyOf"]
+            is not second["properties"]["items"]["items"]["anyOf"]
+        )
+
+    def test_non_json_values_are_copied(self):
+        """Values that are not JSON literals fall back to a deep copy."""
+
+        class WithTuple(DereferencedSchemaModel, BaseModel):
+            model_config = ConfigDict(json_schema_extra={"examples": [(1, [2])]})
+            inner: Inner
+
+        first, second = get_dereferenced_schema(WithTuple), get_dereferenced_schema(WithTuple)
+        assert first["examples"] == [(1, [2])]
+        assert first["examples"][0][1] is not second["examples"][0][1]
+
+    def test_deep_schemas_are_copied(self):
+        """Schemas nested deeper than the compiler accepts are still copied."""
+        extra = leaf = {"type": "integer"}
+        for _ in range(300):
+            extra = {"items": [extra]}
+
+        class Deep(DereferencedSchemaModel, BaseModel):
+            model_config = ConfigDict(json_schema_extra={"x-nested": extra})
+            inner: Inner
+
+        node = get_dereferenced_schema(Deep)["x-nested"]
+        assert node is not extra
+        while "items" in node:
+            node = node["items"][0]
+        assert node == leaf
+        assert node is not leaf
+
+    def test_cache_does_not_pin_model_classes(self):
+        """Cached schemas are dropped once their model class is collected."""
+
+        class Ephemeral(DereferencedSchemaModel, BaseModel):
+            inner: Inner
+
+        get_dereferenced_schema(Ephemeral)
+
+        ref = weakref.ref(Ephemeral)
+        del Ephemeral
+        gc.collect()
+        assert ref() is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -6,7 +6,7 @@ Tests translation from Pydantic models to SQL strings.
 
 import pytest
 from structured_query_builder import *
-from structured_query_builder.translator import translate_query, SQLTranslator
+from structured_query_builder.translator import translate_query, translate_query_many, SQLTranslator
 
 
 class TestBasicTranslation:
@@ -132,6 +132,51 @@ class TestAggregateTranslation:
         sql = translate_query(query)
         assert "GROUP BY vendor" in sql
 
+    def test_min_max_of_group_key_become_columns(self):
+        """SELECT vendor, MIN(vendor), MAX(regular_price) ... GROUP BY vendor"""
+        query = Query(
+            select=[
+                ColumnExpr(source=QualifiedColumn(column=Column.vendor)),
+                AggregateExpr(
+                    function=AggregateFunc.min,
+                    column=Column.vendor,
+                    alias="first_vendor"
+                ),
+                AggregateExpr(
+                    function=AggregateFunc.max,
+                    column=Column.regular_price,
+                    alias="max_price"
+                )
+            ],
+            from_=FromClause(table=Table.product_offers),
+            group_by=GroupByClause(columns=[Column.vendor])
+        )
+        sql = translate_query(query)
+        assert isinstance(query.select[1], AggregateExpr)
+        assert "vendor AS first_vendor" in sql
+        assert "MIN(vendor)" not in sql
+        assert "MAX(regular_price) AS max_price" in sql
+
+    def test_group_key_aggregate_rewrite_can_be_disabled(self):
+        """Translator subclasses can opt out of the MIN/MAX group key rewrite."""
+
+        class LiteralTranslator(SQLTranslator):
+            optimize_group_by_aggregates = False
+
+        query = Query(
+            select=[
+                AggregateExpr(
+                    function=AggregateFunc.max,
+                    column=Column.vendor,
+                    alias="max_vendor"
+                )
+            ],
+            from_=FromClause(table=Table.product_offers),
+            group_by=GroupByClause(columns=[Column.vendor])
+        )
+        assert "MAX(vendor) AS max_vendor" in LiteralTranslator().translate(query)
+        assert "vendor AS max_vendor" in translate_query(query)
+
 
 class TestWindowTranslation:
     """Test window function translation."""
@@ -588,3 +633,22 @@ class TestComplexQueries:
         assert "title" in sql
         assert "regular_price - markdown_price" in sql
         assert "is_markdown = TRUE" in sql
+
+
+class TestBatchTranslation:
+    """Test translating several queries with one translator."""
+
+    def test_translate_query_many_matches_single(self):
+        """Batch output equals per-query output, in input order."""
+        queries = [
+            Query(
+                select=[ColumnExpr(source=QualifiedColumn(column=column))],
+                from_=FromClause(table=Table.product_offers)
+            )
+            for column in (Column.vendor, Column.category, Column.brand)
+        ]
+        assert translate_query_many(queries) == [translate_query(q) for q in queries]
+
+    def test_translate_query_many_empty(self):
+        """An empty batch yields no SQL."""
+        assert translate_query_many([]) == []
@@ -39,7 +39,7 @@ class TestVertexAISchemaGeneration:
 
     def test_query_schema_is_valid(self):
         """Test that Query model generates valid JSON schema."""
-        schema = Query.model_json_schema()
+        schema = Query.json_schema()
 
         # Basic schema validation
         assert "properties" in schema
@@ -55,7 +55,7 @@ class TestVertexAISchemaGeneration:
 
         This is critical for Google Vertex AI compatibility.
         """
-        schema = Query.model_json_schema()
+        schema = Query.json_schema()
 
         def check_no_recursive_refs(obj, path="", visited=None):
             if visited is None:
@@ -79,7 +79,7 @@ class TestVertexAISchemaGeneration:
 
     def test_discriminated_unions_present(self):
         """Test that discriminated unions are properly configured."""
-        schema = Query.model_json_schema()
+        schema = Query.json_schema()
 
         # SelectExpr should be a union with discriminator
         defs = schema.get("$defs", schema.get("definitions", {}))
@@ -5,7 +5,7 @@ Each model type has a deterministic translation to SQL.
 Handles proper quoting, escaping, and formatting.
 """
 
-from typing import Union
+from typing import Iterable, Union
 from .query import Query
 from .expressions import (
     ColumnExpr,
@@ -34,7 +34,7 @@ from .clauses import (
     OrderByClause,
     LimitClause,
 )
-from .enums import ComparisonOp, AggregateFunc
+from .enums import ENUM_SQL, ComparisonOp, AggregateFunc
 
 
 class SQLTranslator:
@@ -47,6 +47,10 @@ class SQLTranslator:
     - No additional validation (models are correct by construction)
     """
 
+    # Emit MIN/MAX over a GROUP BY key as the key itself; subclasses can set
+    # this to False to keep the aggregates as written
+    optimize_group_by_aggregates = True
+
     def translate(self, query: Query) -> str:
         """
         Translate a complete Query to SQL.
@@ -56,7 +60,12 @@ class SQLTranslator:
         parts = []
 
         # SELECT clause
-        parts.append(self._translate_select(query.select))
+        group_keys = (
+            frozenset(query.group_by.columns)
+            if query.group_by and self.optimize_group_by_aggregates
+            else frozenset()
+        )
+        parts.append(self._translate_select(query.select, group_keys))
 
         # FROM clause
         parts.append(self._translate_from(query.from_))
@@ -87,11 +96,35 @@ class SQLTranslator:
     # SELECT Expressions
     # ========================================================================
 
-    def _translate_select(self, expressions: list[SelectExpr]) -> str:
-        """Translate SELECT clause."""
-        expr_strs = [self._translate_select_expr(expr) for expr in expressions]
+    def _translate_select(
+        self, expressions: list[SelectExpr], group_keys: frozenset = frozenset()
+    ) -> str:
+        """
+        Translate SELECT clause.
+
+        MIN/MAX of a column in group_keys is emitted as the plain column:
+        within a group the key has a single value, so both aggregates equal
+        it and the database need not keep aggregate state for it.
+        """
+        expr_strs = [
+            f"{ENUM_SQL[expr.column]} AS {expr.alias}"
+            if group_keys and self._is_group_key_extreme(expr, group_keys)
+            else self._translate_select_expr(expr)
+            for expr in expressions
+        ]
         return "SELECT " + ",\n       ".join(expr_strs)
 
+    @staticmethod
+    def _is_group_key_extreme(expr: SelectExpr, group_keys: frozenset) -> bool:
+        """Whether expr is MIN/MAX of a bare, unqualified GROUP BY column."""
+        return (
+            isinstance(expr, AggregateExpr)
+            and expr.function in (AggregateFunc.min, AggregateFunc.max)
+            and expr.column in group_keys
+            and expr.table_alias is None
+            and expr.arithmetic_input is None
+        )
+
     def _translate_select_expr(self, expr: SelectExpr) -> str:
         """Translate a single SELECT expression."""
         if isinstance(expr, ColumnExpr):
@@ -112,8 +145,8 @@ class SQLTranslator:
     def _translate_qualified_column(self, col: QualifiedColumn) -> str:
         """Translate a qualified column reference."""
         if col.table_alias:
-            return f"{col.table_alias}.{col.column.value}"
-        return col.column.value
+            return f"{col.table_alias}.{ENUM_SQL[col.column]}"
+        return ENUM_SQL[col.column]
 
     def _translate_column_expr(self, expr: ColumnExpr) -> str:
         """Translate simple column selection."""
@@ -127,9 +160,9 @@ class SQLTranslator:
         # Left operand
         if expr.left_column:
             if expr.left_table_alias:
-                left = f"{expr.left_table_alias}.{expr.left_column.value}"
+                left = f"{expr.left_table_alias}.{ENUM_SQL[expr.left_column]}"
             else:
-                left = expr.left_column.value
+                left = ENUM_SQL[expr.left_column]
         elif expr.left_value is not None:
             left = str(expr.left_value)
         else:
@@ -138,15 +171,15 @@ class SQLTranslator:
         # Right operand
         if expr.right_column:
             if expr.right_table_alias:
-                right = f"{expr.right_table_alias}.{expr.right_column.value}"
+                right = f"{expr.right_table_alias}.{ENUM_SQL[expr.right_column]}"
             else:
-                right = expr.right_column.value
+                right = ENUM_SQL[expr.right_column]
         elif expr.right_value is not None:
             right = str(expr.right_value)
         else:
             raise ValueError("Binary arithmetic must have right operand")
 
-        return f"({left} {expr.operator.value} {right})"
+        return f"({left} {ENUM_SQL[expr.operator]} {right})"
 
     def _translate_binary_arithmetic(self, expr: BinaryArithmetic) -> str:
         """Translate two-operand arithmetic."""
@@ -156,7 +189,7 @@ class SQLTranslator:
         """Translate three-operand nested arithmetic."""
         # Inner expression
         if expr.inner_left_column:
-            inner_left = expr.inner_left_column.value
+            inner_left = ENUM_SQL[expr.inner_left_column]
             if expr.inner_left_table_alias:
                 inner_left = f"{expr.inner_left_table_alias}.{inner_left}"
         elif expr.inner_left_value is not None:
@@ -165,7 +198,7 @@ class SQLTranslator:
             raise ValueError("Compound arithmetic must have inner left operand")
 
         if expr.inner_right_column:
-            inner_right = expr.inner_right_column.value
+            inner_right = ENUM_SQL[expr.inner_right_column]
             if expr.inner_right_table_alias:
                 inner_right = f"{expr.inner_right_table_alias}.{inner_right}"
         elif expr.inner_right_value is not None:
@@ -173,11 +206,11 @@ class SQLTranslator:
         else:
             raise ValueError("Compound arithmetic must have inner right operand")
 
-        inner = f"({inner_left} {expr.inner_operator.value} {inner_right})"
+        inner = f"({inner_left} {ENUM_SQL[expr.inner_operator]} {inner_right})"
 
         # Outer operand
         if expr.outer_column:
-            outer = expr.outer_column.value
+            outer = ENUM_SQL[expr.outer_column]
             if expr.outer_table_alias:
                 outer = f"{expr.outer_table_alias}.{outer}"
         elif expr.outer_value is not None:
@@ -185,11 +218,11 @@ class SQLTranslator:
         else:
             raise ValueError("Compound arithmetic must have outer operand")
 
-        return f"({inner} {expr.outer_operator.value} {outer}) AS {expr.alias}"
+        return f"({inner} {ENUM_SQL[expr.outer_operator]} {outer}) AS {expr.alias}"
 
     def _translate_aggregate(self, expr: AggregateExpr) -> str:
         """Translate aggregate function."""
-        func = expr.function.value
+        func = ENUM_SQL[expr.function]
 
         # Handle percentile functions with percentile parameter
         if expr.function in (AggregateFunc.percentile_cont, AggregateFunc.percentile_disc):
@@ -202,9 +235,9 @@ class SQLTranslator:
             if expr.arithmetic_input:
                 arg = self._translate_binary_arithmetic_raw(expr.arithmetic_input)
             elif expr.table_alias:
-                arg = f"{expr.table_alias}.{expr.column.value}"
+                arg = f"{expr.table_alias}.{ENUM_SQL[expr.column]}"
             else:
-                arg = expr.column.value
+                arg = ENUM_SQL[expr.column]
 
             return f"{func}({expr.percentile}) WITHIN GROUP (ORDER BY {arg}) AS {expr.alias}"
 
@@ -224,9 +257,9 @@ class SQLTranslator:
         else:
             # Handle table alias if present
             if expr.table_alias:
-                arg = f"{expr.table_alias}.{expr.column.value}"
+                arg = f"{expr.table_alias}.{ENUM_SQL[expr.column]}"
             else:
-                arg = expr.column.value
+                arg = ENUM_SQL[expr.column]
             if expr.distinct:
                 arg = f"DISTINCT {arg}"
 
@@ -234,23 +267,23 @@ class SQLTranslator:
 
     def _translate_window(self, expr: WindowExpr) -> str:
         """Translate window function."""
-        func = expr.function.value
+        func = ENUM_SQL[expr.function]
 
         # Function argument
         if expr.column is None:
-            if expr.function.value == "COUNT":
+            if ENUM_SQL[expr.function] == "COUNT":
                 arg = "*"
             else:
                 arg = ""
         else:
             # Include table alias if specified (for derived table columns)
             if expr.table_alias:
-                arg = f"{expr.table_alias}.{expr.column.value}"
+                arg = f"{expr.table_alias}.{ENUM_SQL[expr.column]}"
             else:
-                arg = expr.column.value
+                arg = ENUM_SQL[expr.column]
 
         # Handle LAG/LEAD with offset and default
-        if expr.function.value in ("LAG", "LEAD"):
+        if ENUM_SQL[expr.function] in ("LAG", "LEAD"):
             parts = [arg] if arg else []
             if expr.offset != 1:
                 parts.append(str(expr.offset))
@@ -265,12 +298,12 @@ class SQLTranslator:
         over_parts = []
 
         if expr.partition_by:
-            partition_cols = ", ".join(col.value for col in expr.partition_by)
+            partition_cols = ", ".join(ENUM_SQL[col] for col in expr.partition_by)
             over_parts.append(f"PARTITION BY {partition_cols}")
 
         if expr.order_by:
             order_items = ", ".join(
-                f"{item.column.value} {item.direction.value}"
+                f"{ENUM_SQL[item.column]} {ENUM_SQL[item.direction]}"
                 for item in expr.order_by
             )
             over_parts.append(f"ORDER BY {order_items}")
@@ -285,14 +318,14 @@ class SQLTranslator:
 
         for when in expr.whens:
             # Condition
-            cond_col = when.condition_column.value
-            cond_op = when.condition_operator.value
+            cond_col = ENUM_SQL[when.condition_column]
+            cond_op = ENUM_SQL[when.condition_operator]
             cond_val = self._format_value(when.condition_value)
             parts.append(f"WHEN {cond_col} {cond_op} {cond_val}")
 
             # Result
             if when.then_column:
-                result = when.then_column.value
+                result = ENUM_SQL[when.then_column]
             elif when.then_value is not None:
                 result = self._format_value(when.then_value)
             else:
@@ -301,7 +334,7 @@ class SQLTranslator:
 
         # ELSE clause
         if expr.else_column:
-            else_val = expr.else_column.value
+            else_val = ENUM_SQL[expr.else_column]
         elif expr.else_value is not None:
             else_val = self._format_value(expr.else_value)
         else:
@@ -338,13 +371,13 @@ class SQLTranslator:
         if not conditions:
             return ""
 
-        combined = f" {where.group_logic.value} ".join(conditions)
+        combined = f" {ENUM_SQL[where.group_logic]} ".join(conditions)
         return f"WHERE {combined}"
 
     def _translate_condition_group(self, group: ConditionGroup) -> str:
         """Translate a group of conditions."""
         cond_strs = [self._translate_condition(cond) for cond in group.conditions]
-        combined = f" {group.logic.value} ".join(cond_strs)
+        combined = f" {ENUM_SQL[group.logic]} ".join(cond_strs)
         return f"({combined})" if len(cond_strs) > 1 else combined
 
     def _translate_condition(self, cond) -> str:
@@ -373,7 +406,7 @@ class SQLTranslator:
     def _translate_simple_condition(self, cond) -> str:
         """Translate a single condition (column OP value)."""
         col = self._translate_qualified_column(cond.column)
-        op = cond.operator.value
+        op = ENUM_SQL[cond.operator]
 
         # Handle NULL checks
         if cond.operator in (ComparisonOp.is_null, ComparisonOp.is_not_null):
@@ -395,7 +428,7 @@ class SQLTranslator:
         """Translate column-to-column comparison (left_column OP right_column)."""
         left_col = self._translate_qualified_column(cond.left_column)
         right_col = self._translate_qualified_column(cond.right_column)
-        op = cond.operator.value
+        op = ENUM_SQL[cond.operator]
         return f"{left_col} {op} {right_col}"
 
     def _translate_between_condition(self, cond) -> str:
@@ -408,7 +441,7 @@ class SQLTranslator:
     def _translate_subquery_condition(self, subq_cond: SubqueryCondition) -> str:
         """Translate condition with scalar subquery."""
         col = self._translate_qualified_column(subq_cond.column)
-        op = subq_cond.operator.value
+        op = ENUM_SQL[subq_cond.operator]
         subq = self._translate_scalar_subquery(subq_cond.subquery)
         return f"{col} {op} ({subq})"
 
@@ -421,7 +454,7 @@ class SQLTranslator:
         parts.append(f"SELECT {agg_str}")
 
         # FROM
-        parts.append(f"FROM {subq.table.value}")
+        parts.append(f"FROM {ENUM_SQL[subq.table]}")
 
         # WHERE
         if subq.where:
@@ -429,7 +462,7 @@ class SQLTranslator:
 
         # GROUP BY
         if subq.group_by:
-            group_cols = ", ".join(col.value for col in subq.group_by)
+            group_cols = ", ".join(ENUM_SQL[col] for col in subq.group_by)
             parts.append(f"GROUP BY {group_cols}")
 
         return " ".join(parts)
@@ -450,7 +483,7 @@ class SQLTranslator:
         if not conditions:
             return ""
 
-        combined = f" {where.group_logic.value} ".join(conditions)
+        combined = f" {ENUM_SQL[where.group_logic]} ".join(conditions)
         return f"WHERE {combined}"
 
     # ========================================================================
@@ -463,7 +496,7 @@ class SQLTranslator:
 
         # Base table or derived table
         if from_clause.table:
-            table_str = from_clause.table.value
+            table_str = ENUM_SQL[from_clause.table]
             if from_clause.table_alias:
                 table_str = f"{table_str} AS {from_clause.table_alias}"
             parts.append(f"FROM {table_str}")
@@ -481,8 +514,8 @@ class SQLTranslator:
 
     def _translate_join(self, join: JoinSpec) -> str:
         """Translate JOIN specification with flexible ON conditions."""
-        join_type = join.join_type.value
-        table = join.table.value
+        join_type = ENUM_SQL[join.join_type]
+        table = ENUM_SQL[join.table]
         if join.table_alias:
             table = f"{table} AS {join.table_alias}"
 
@@ -506,7 +539,7 @@ class SQLTranslator:
         parts.append("SELECT " + ", ".join(expr_strs))
 
         # FROM
-        table_str = derived.from_table.value
+        table_str = ENUM_SQL[derived.from_table]
         if derived.table_alias:
             table_str = f"{table_str} AS {derived.table_alias}"
         parts.append(f"FROM {table_str}")
@@ -531,29 +564,29 @@ class SQLTranslator:
 
     def _translate_group_by(self, group_by: GroupByClause) -> str:
         """Translate GROUP BY clause."""
-        cols = ", ".join(col.value for col in group_by.columns)
+        cols = ", ".join(ENUM_SQL[col] for col in group_by.columns)
         return f"GROUP BY {cols}"
 
     def _translate_having(self, having: HavingClause) -> str:
         """Translate HAVING clause."""
         cond_strs = []
         for cond in having.conditions:
-            func = cond.function.value
-            col = cond.column.value if cond.column else "*"
-            op = cond.operator.value
+            func = ENUM_SQL[cond.function]
+            col = ENUM_SQL[cond.column] if cond.column else "*"
+            op = ENUM_SQL[cond.operator]
             value = str(cond.value)
             cond_strs.append(f"{func}({col}) {op} {value}")
 
-        combined = f" {having.logic.value} ".join(cond_strs)
+        combined = f" {ENUM_SQL[having.logic]} ".join(cond_strs)
         return f"HAVING {combined}"
 
     def _translate_order_by(self, order_by: OrderByClause) -> str:
         """Translate ORDER BY clause."""
         item_strs = []
         for item in order_by.items:
-            item_str = f"{item.column.value} {item.direction.value}"
+            item_str = f"{ENUM_SQL[item.column]} {ENUM_SQL[item.direction]}"
             if item.nulls:
-                item_str += f" NULLS {item.nulls.value}"
+                item_str += f" NULLS {ENUM_SQL[item.nulls]}"
             item_strs.append(item_str)
 
         return f"ORDER BY {', '.join(item_strs)}"
@@ -593,3 +626,17 @@ def translate_query(query: Query) -> str:
     """
     translator = SQLTranslator()
     return translator.translate(query)
+
+
+def translate_query_many(queries: Iterable[Query]) -> list[str]:
+    """
+    Translate several Query models with a single translator instance.
+
+    Args:
+        queries: Query models to translate
+
+    Returns:
+        SQL strings in the same order as the input queries
+    """
+    translator = SQLTranslator()
+    return [translator.translate(query) for query in queries]